@@ -1,6 +1,6 @@
 """Database adapters package."""
 
-from .base import DatabaseAdapter
+from .base import DatabaseAdapter, AsyncDatabaseAdapter
 from .factory import get_adapter
 
-__all__ = ["DatabaseAdapter", "get_adapter"]
+__all__ = ["DatabaseAdapter", "AsyncDatabaseAdapter", "get_adapter"]
@@ -3,11 +3,36 @@
 Defines the abstract interface that all database adapters must implement.
 """
 
+import hashlib
+import queue
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Hashable, Sequence
 from dataclasses import dataclass
 
 
+# Statements that can change the set of tables or their structure
+DDL_KEYWORDS = frozenset({"CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME"})
+
+# Any of those keywords, wherever it appears in the SQL text
+DDL_WORD_RE = re.compile(r"\b(?:" + "|".join(sorted(DDL_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+# Leading whitespace and comments, followed by the first word of a statement
+_LEAD_TOKEN_RE = re.compile(r"(?:\s+|--[^\n]*(?:\n|\Z)|/\*.*?\*/)*([A-Za-z_]\w*)", re.DOTALL)
+
+# Default cap on the number of rows returned by a single query
+DEFAULT_MAX_ROWS = 10000
+
+# Number of statements whose result layout (column names and converters)
+# is remembered per adapter
+DESCRIPTION_CACHE_SIZE = 64
+
+
 @dataclass
 class TableInfo:
     """Table information."""
@@ -30,14 +55,448 @@ class ColumnInfo:
 
 @dataclass
 class QueryResult:
-    """Query execution result."""
+    """
+    Query execution result.
+    
+    Row values are kept in ``data`` as one list per row, in ``columns``
+    order, so column names are not repeated per row. ``rows`` builds the
+    dict-per-row form on demand. ``next_cursor`` is set on a page of a
+    paginated query when more rows follow.
+    """
     success: bool
-    columns: list[str] | None = None
-    rows: list[dict[str, Any]] | None = None
+    columns: list[str] | tuple[str, ...] | None = None
+    data: list[list[Any]] | None = None
     row_count: int = 0
     affected_rows: int | None = None
     message: str = ""
     error: str | None = None
+    truncated: bool = False
+    next_cursor: str | None = None
+    
+    @property
+    def rows(self) -> list[dict[str, Any]] | None:
+        """Rows as dicts keyed by column name."""
+        if self.data is None:
+            return None
+        return [dict(zip(self.columns, values)) for values in self.data]
+
+
+def first_keyword(sql: str) -> str:
+    """
+    Return the first keyword of a SQL statement in upper case.
+    
+    Leading whitespace and comments are skipped, and only the keyword itself
+    is upper-cased so large statements are never copied. Returns an empty
+    string if the statement does not start with a word.
+    """
+    match = _LEAD_TOKEN_RE.match(sql)
+    return match.group(1).upper() if match else ""
+
+
+def _decode(value: bytes | None) -> str | None:
+    return value.decode('utf-8', errors='replace') if value is not None else None
+
+
+def _format_interval(value: timedelta | None) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _to_float(value: Decimal | None) -> float | None:
+    return float(value) if value is not None else None
+
+
+def _isoformat(value: date | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+# Converters for result values the JSON encoder cannot handle as-is, shared
+# by every adapter: decimals become floats and dates ISO 8601 strings.
+# Converters are chosen from a sample row and reused for the rest of the
+# result, so they must also accept NULL.
+VALUE_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    Decimal: _to_float,
+    datetime: _isoformat,
+    date: _isoformat,
+    timedelta: _format_interval,
+    bytes: _decode,
+}
+
+# Rows inspected when choosing converters, so that a NULL in the first row
+# does not leave its column on the per-value fallback
+CONVERTER_SAMPLE_ROWS = 10
+
+# Value types that never need conversion
+_PASSTHROUGH_TYPES = frozenset({int, float, str, bool})
+
+
+def convert_value(value: Any) -> Any:
+    """Convert a single result value into a JSON-friendly type."""
+    if isinstance(value, Decimal):
+        return float(value)
+    elif isinstance(value, (datetime, date)):
+        return value.isoformat()
+    elif isinstance(value, timedelta):
+        return str(value)
+    elif isinstance(value, bytes):
+        return _decode(value)
+    return value
+
+
+def build_converters(
+    rows: Sequence[Any],
+    value_converters: dict[type, Callable[[Any], Any]] = VALUE_CONVERTERS,
+    fallback: Callable[[Any], Any] = convert_value
+) -> list[Callable[[Any], Any] | None]:
+    """
+    Choose a converter for each column from the value types in the first rows.
+    
+    Each column is judged by its first non-NULL value among the first
+    CONVERTER_SAMPLE_ROWS rows. Returns None for columns that need no
+    conversion. Columns that are NULL throughout the sample or hold an
+    unfamiliar type get the fallback converter.
+    """
+    sample = rows[:CONVERTER_SAMPLE_ROWS]
+    converters = []
+    for index, value in enumerate(sample[0]):
+        if value is None:
+            value = next((row[index] for row in sample if row[index] is not None), None)
+        value_type = type(value)
+        converter = value_converters.get(value_type)
+        if converter is not None:
+            converters.append(converter)
+        elif value_type in _PASSTHROUGH_TYPES:
+            converters.append(None)
+        else:
+            converters.append(fallback)
+    return converters
+
+
+def convert_rows(rows: Any, converters: list[Callable[[Any], Any] | None]) -> list[list[Any]]:
+    """
+    Copy result rows into lists, converting only the columns that need it.
+    
+    Rows whose columns all pass through are copied with list() alone.
+    """
+    conversions = [(index, conv) for index, conv in enumerate(converters) if conv is not None]
+    if not conversions:
+        return [list(row) for row in rows]
+    data = []
+    for row in rows:
+        values = list(row)
+        for index, conv in conversions:
+            values[index] = conv(values[index])
+        data.append(values)
+    return data
+
+
+class LRUCache:
+    """
+    Bounded cache that evicts the least recently used entry when full.
+    
+    ``get`` returns None for missing keys, so None should not be stored.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entries if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+class TTLCache(LRUCache):
+    """LRU cache whose entries expire ``ttl`` seconds after being stored."""
+    
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        super().__init__(maxsize)
+        self.ttl = ttl
+    
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entries if full."""
+        super().set(key, (time.monotonic() + self.ttl, value))
+
+
+class MetadataCache(TTLCache):
+    """
+    In-process cache for list_tables/describe_table results.
+    
+    Entries are keyed by (db_type, schema, table_name) and expire after ``ttl``
+    seconds. Table listings use None as table_name, followed by the limit
+    and offset for a single page, "count" for the number of tables or
+    "columns" for the columns of every table. When more than ``maxsize``
+    entries are stored the least recently used one is evicted.
+    """
+    
+    def invalidate(self, table: str | None = None) -> None:
+        """
+        Drop cached metadata.
+        
+        Args:
+            table: Only drop entries for this table (plus all table listings).
+                   Drops everything if omitted.
+        """
+        if table is None:
+            self._entries.clear()
+            return
+        for key in list(self._entries):
+            if key[2] is None or key[2] == table:
+                del self._entries[key]
+    
+    def get_listing(
+        self,
+        db_type: str,
+        schema: str | None,
+        limit: int | None,
+        offset: int
+    ) -> list[TableInfo] | None:
+        """
+        Return a cached page of a table listing, or None if not cached.
+        
+        A page is cut from the full listing when that is cached, so only
+        pages read before it need entries of their own.
+        """
+        tables = self.get((db_type, schema, None))
+        if tables is not None:
+            return tables[offset:] if limit is None else tables[offset:offset + limit]
+        return self.get((db_type, schema, None, limit, offset))
+    
+    def set_listing(
+        self,
+        db_type: str,
+        schema: str | None,
+        limit: int | None,
+        offset: int,
+        tables: list[TableInfo]
+    ) -> None:
+        """Cache a page of a table listing (the full listing if unbounded)."""
+        if limit is None and offset == 0:
+            self.set((db_type, schema, None), tables)
+        else:
+            self.set((db_type, schema, None, limit, offset), tables)
+    
+    def get_descriptions(
+        self,
+        db_type: str,
+        schema: str | None,
+        table_names: Sequence[str]
+    ) -> tuple[dict[str, list[ColumnInfo]], list[str]]:
+        """
+        Look up the cached columns of several tables.
+        
+        Returns:
+            Table name -> columns for the cached tables, and the names of
+            the tables that still have to be described
+        """
+        found: dict[str, list[ColumnInfo]] = {}
+        missing: list[str] = []
+        for table_name in table_names:
+            columns = self.get((db_type, schema, table_name))
+            if columns is not None:
+                found[table_name] = columns
+            else:
+                missing.append(table_name)
+        return found, missing
+    
+    def set_descriptions(
+        self,
+        db_type: str,
+        schema: str | None,
+        columns_by_table: dict[str, list[ColumnInfo]],
+        whole_schema: bool = True
+    ) -> None:
+        """
+        Cache the columns of several tables.
+        
+        Each table's entry is stored, so describing any of them later is a
+        cache hit. With whole_schema the mapping itself is cached as the
+        schema's full description too.
+        """
+        for table_name, columns in columns_by_table.items():
+            self.set((db_type, schema, table_name), columns)
+        if whole_schema:
+            self.set((db_type, schema, None, "columns"), columns_by_table)
+    
+    def invalidate_listings(self) -> None:
+        """Drop cached table listings, keeping table descriptions."""
+        for key in list(self._entries):
+            if key[2] is None:
+                del self._entries[key]
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections that share the same parameters.
+    
+    Idle connections are reused most-recently-released first and checked with
+    ``validate`` before being handed out; connections that fail the check are
+    closed and replaced. ``reset`` runs on release (rollback by default).
+    The server info gathered on the first connect is kept in ``server_info``
+    so later connects can skip those queries.
+    """
+    
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        validate: Callable[[Any], None] | None = None,
+        reset: Callable[[Any], None] | None = None,
+        min_size: int = 1,
+        max_size: int = 8,
+    ):
+        self._factory = factory
+        self._validate = validate
+        self._reset = reset or (lambda conn: conn.rollback())
+        self.min_size = min_size
+        self.max_size = max_size
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.server_info: dict[str, Any] | None = None
+        
+        for _ in range(min_size):
+            self._size += 1
+            self._idle.put(self._open())
+    
+    def _open(self) -> Any:
+        """Open a connection for a slot already counted in ``_size``."""
+        try:
+            return self._factory()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+    
+    def _discard(self, conn: Any) -> None:
+        with self._lock:
+            self._size -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    def acquire(self, timeout: float | None = 30) -> Any:
+        """
+        Get a connection from the pool, opening a new one if none are idle.
+        
+        Blocks for up to ``timeout`` seconds when ``max_size`` connections
+        are already in use.
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                # Reserve the slot under the lock, so concurrent callers
+                # cannot both grow the pool past max_size
+                with self._lock:
+                    can_grow = self._size < self.max_size
+                    if can_grow:
+                        self._size += 1
+                if can_grow:
+                    return self._open()
+                try:
+                    conn = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError("Timed out waiting for a pooled connection")
+            
+            if self._validate is None:
+                return conn
+            try:
+                self._validate(conn)
+                return conn
+            except Exception:
+                self._discard(conn)
+    
+    def release(self, conn: Any) -> None:
+        """Return a connection to the pool, resetting any open transaction."""
+        try:
+            self._reset(conn)
+        except Exception:
+            self._discard(conn)
+            return
+        self._idle.put(conn)
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+_pools: dict[tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(
+    db_type: str,
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    dbname: str,
+    factory: Callable[[], Any],
+    validate: Callable[[Any], None] | None = None,
+    reset: Callable[[Any], None] | None = None,
+) -> ConnectionPool:
+    """
+    Get the shared connection pool for a set of connection parameters.
+    
+    The password is part of the key (hashed) so a pooled connection is never
+    handed to a caller that could not have authenticated it.
+    """
+    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
+    key = (db_type, host, port, username, dbname, password_hash)
+    with _pools_lock:
+        pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    
+    # Create outside the lock, opening connections can be slow
+    pool = ConnectionPool(factory, validate=validate, reset=reset)
+    with _pools_lock:
+        existing = _pools.setdefault(key, pool)
+    if existing is not pool:
+        pool.close()
+    return existing
+
+
+def close_all_pools() -> None:
+    """Close every shared connection pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
 
 
 class DatabaseAdapter(ABC):
@@ -46,12 +505,21 @@ class DatabaseAdapter(ABC):
     def __init__(self):
         self._connection = None
         self._connected = False
+        self._pool: ConnectionPool | None = None
+        self._metadata_cache = MetadataCache()
+        # SQL text -> (column names, value converters) of its result set
+        self._description_cache = LRUCache(DESCRIPTION_CACHE_SIZE)
     
     @property
     def is_connected(self) -> bool:
         """Check if connected to database."""
         return self._connected
     
+    def invalidate_metadata(self) -> None:
+        """Forget cached table listings, table structures and result layouts."""
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
+    
     @abstractmethod
     def connect(
         self,
@@ -76,13 +544,19 @@ class DatabaseAdapter(ABC):
         pass
     
     @abstractmethod
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
+    def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
         """
         Execute a SQL query.
         
         Args:
             sql: SQL statement to execute
             timeout: Query timeout in seconds
+            max_rows: Maximum number of rows to fetch (None for no limit)
             
         Returns:
             QueryResult with execution results
@@ -90,18 +564,61 @@ class DatabaseAdapter(ABC):
         pass
     
     @abstractmethod
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
+    def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute one statement once per parameter set, as a single batch.
+        
+        Args:
+            sql: Statement with placeholders in the driver's style
+                 ($1 for PostgreSQL, %s for MySQL and SQL Server, ? for
+                 SQLite and DM8)
+            params_batch: One sequence of parameter values per execution
+            timeout: Timeout in seconds
+            
+        Returns:
+            QueryResult with the total affected rows (-1 if the driver
+            does not report it)
+        """
+        pass
+    
+    @abstractmethod
+    def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
         """
-        List all tables in the database.
+        List tables in the database, ordered by name.
         
         Args:
             schema: Optional schema name to filter tables
+            limit: Maximum number of tables to return (None for all)
+            offset: Number of tables to skip
             
         Returns:
             List of TableInfo objects
         """
         pass
     
+    @abstractmethod
+    def count_tables(self, schema: str | None = None) -> int:
+        """
+        Count the tables list_tables would return without a limit.
+        
+        Args:
+            schema: Optional schema name to filter tables
+            
+        Returns:
+            Number of tables (0 if they cannot be listed)
+        """
+        pass
+    
     @abstractmethod
     def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """
@@ -116,6 +633,220 @@ class DatabaseAdapter(ABC):
         """
         pass
     
+    @abstractmethod
+    def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """
+        Get the structure of every table in a schema with one catalog query.
+        
+        Args:
+            schema: Optional schema name
+            
+        Returns:
+            Table name -> list of ColumnInfo objects, in column order
+        """
+        pass
+    
+    @abstractmethod
+    def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """
+        Get the structure of several tables with one catalog query.
+        
+        Tables already in the metadata cache are not queried again, and
+        are still returned if the query fails.
+        
+        Args:
+            table_names: Names of the tables, each given once
+            schema: Optional schema name
+            
+        Returns:
+            Table name -> list of ColumnInfo objects, for the tables found
+        """
+        pass
+    
+    @property
+    @abstractmethod
+    def db_type(self) -> str:
+        """Return the database type identifier."""
+        pass
+
+
+class AsyncDatabaseAdapter(ABC):
+    """
+    Abstract base class for asyncio database adapters.
+    
+    Mirrors DatabaseAdapter with coroutine methods. Each query borrows a
+    connection from the adapter's driver-side pool, so concurrent tool calls
+    share one event loop instead of waiting on each other.
+    """
+    
+    def __init__(self):
+        self._pool = None
+        self._connected = False
+        self._metadata_cache = MetadataCache()
+        # SQL text -> (column names, value converters) of its result set
+        self._description_cache = LRUCache(DESCRIPTION_CACHE_SIZE)
+    
+    @property
+    def is_connected(self) -> bool:
+        """Check if connected to database."""
+        return self._connected
+    
+    def invalidate_metadata(self) -> None:
+        """Forget cached table listings, table structures and result layouts."""
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
+    
+    @abstractmethod
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        dbname: str,
+        **kwargs
+    ) -> dict[str, Any]:
+        """
+        Connect to the database and open the connection pool.
+        
+        Returns:
+            dict with connection info (version, current_user, etc.)
+        """
+        pass
+    
+    @abstractmethod
+    async def disconnect(self) -> None:
+        """Close the connection pool."""
+        pass
+    
+    @abstractmethod
+    async def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """
+        Execute a SQL query.
+        
+        Args:
+            sql: SQL statement to execute
+            timeout: Query timeout in seconds
+            max_rows: Maximum number of rows to fetch (None for no limit)
+            
+        Returns:
+            QueryResult with execution results
+        """
+        pass
+    
+    @abstractmethod
+    async def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute one statement once per parameter set, as a single batch.
+        
+        Args:
+            sql: Statement with placeholders in the driver's style
+                 ($1 for PostgreSQL, %s for MySQL and SQL Server, ? for
+                 SQLite and DM8)
+            params_batch: One sequence of parameter values per execution
+            timeout: Timeout in seconds
+            
+        Returns:
+            QueryResult with the total affected rows (-1 if the driver
+            does not report it)
+        """
+        pass
+    
+    @abstractmethod
+    async def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """
+        List tables in the database, ordered by name.
+        
+        Args:
+            schema: Optional schema name to filter tables
+            limit: Maximum number of tables to return (None for all)
+            offset: Number of tables to skip
+            
+        Returns:
+            List of TableInfo objects
+        """
+        pass
+    
+    @abstractmethod
+    async def count_tables(self, schema: str | None = None) -> int:
+        """
+        Count the tables list_tables would return without a limit.
+        
+        Args:
+            schema: Optional schema name to filter tables
+            
+        Returns:
+            Number of tables (0 if they cannot be listed)
+        """
+        pass
+    
+    @abstractmethod
+    async def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
+        """
+        Get table structure/schema.
+        
+        Args:
+            table_name: Name of the table
+            schema: Optional schema name
+            
+        Returns:
+            List of ColumnInfo objects
+        """
+        pass
+    
+    @abstractmethod
+    async def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """
+        Get the structure of every table in a schema with one catalog query.
+        
+        Args:
+            schema: Optional schema name
+            
+        Returns:
+            Table name -> list of ColumnInfo objects, in column order
+        """
+        pass
+    
+    @abstractmethod
+    async def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """
+        Get the structure of several tables with one catalog query.
+        
+        Tables already in the metadata cache are not queried again, and
+        are still returned if the query fails.
+        
+        Args:
+            table_names: Names of the tables, each given once
+            schema: Optional schema name
+            
+        Returns:
+            Table name -> list of ColumnInfo objects, for the tables found
+        """
+        pass
+    
     @property
     @abstractmethod
     def db_type(self) -> str:
@@ -1,21 +1,173 @@
 """DM8 (达梦) database adapter using jaydebeapi JDBC driver."""
 
+import functools
 import os
-from typing import Any
-from decimal import Decimal
-from datetime import datetime, date, timedelta
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Sequence
 
-from .base import DatabaseAdapter, TableInfo, ColumnInfo, QueryResult
+from .base import (
+    DatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+    get_pool,
+)
 
-try:
-    import jaydebeapi
-    JAYDEBEAPI_AVAILABLE = True
-except ImportError:
-    JAYDEBEAPI_AVAILABLE = False
+# Leading keywords of statements that return a result set
+_SELECT_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "DESCRIBE", "EXPLAIN"})
 
+# Rows the JDBC driver transfers per network round trip
+JDBC_FETCH_SIZE = 1000
 
+# JDBC prepared statements kept open per connection; describe_tables adds
+# one per distinct table count, so the least recently used are closed
+PREPARED_STATEMENT_CACHE_SIZE = 32
+
+# Metadata queries (Oracle-compatible dictionary views), run as JDBC
+# prepared statements with bound parameters
+_LIST_TABLES_SQL = """
+    SELECT TABLE_NAME, 'TABLE' AS TABLE_TYPE
+    FROM USER_TABLES
+    ORDER BY TABLE_NAME
+    LIMIT ? OFFSET ?
+"""
+
+_LIST_SCHEMA_TABLES_SQL = """
+    SELECT TABLE_NAME, 'TABLE' AS TABLE_TYPE
+    FROM ALL_TABLES
+    WHERE OWNER = ?
+    ORDER BY TABLE_NAME
+    LIMIT ? OFFSET ?
+"""
+
+_COUNT_TABLES_SQL = "SELECT COUNT(*) FROM USER_TABLES"
+
+_COUNT_SCHEMA_TABLES_SQL = "SELECT COUNT(*) FROM ALL_TABLES WHERE OWNER = ?"
+
+# LIMIT needs a row count; the largest BIGINT stands in for "all"
+_NO_LIMIT = 9223372036854775807
+
+# Primary key columns are collected once in a CTE and joined to the column
+# list, instead of being looked up again for every column
+_DESCRIBE_TABLE_SQL = """
+    WITH pk_cols AS (
+        SELECT cols.COLUMN_NAME
+        FROM USER_CONS_COLUMNS cols
+        JOIN USER_CONSTRAINTS cons ON cons.CONSTRAINT_NAME = cols.CONSTRAINT_NAME
+        WHERE cons.CONSTRAINT_TYPE = 'P'
+        AND cons.TABLE_NAME = ?
+    )
+    SELECT 
+        c.COLUMN_NAME,
+        c.DATA_TYPE,
+        c.NULLABLE,
+        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 'Y' ELSE 'N' END AS IS_PK,
+        c.DATA_DEFAULT
+    FROM USER_TAB_COLUMNS c
+    LEFT JOIN pk_cols pk ON pk.COLUMN_NAME = c.COLUMN_NAME
+    WHERE c.TABLE_NAME = ?
+    ORDER BY c.COLUMN_ID
+"""
+
+_DESCRIBE_SCHEMA_TABLE_SQL = """
+    WITH pk_cols AS (
+        SELECT cols.COLUMN_NAME
+        FROM ALL_CONS_COLUMNS cols
+        JOIN ALL_CONSTRAINTS cons
+            ON cons.OWNER = cols.OWNER AND cons.CONSTRAINT_NAME = cols.CONSTRAINT_NAME
+        WHERE cons.CONSTRAINT_TYPE = 'P'
+        AND cons.OWNER = ?
+        AND cons.TABLE_NAME = ?
+    )
+    SELECT 
+        c.COLUMN_NAME,
+        c.DATA_TYPE,
+        c.NULLABLE,
+        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 'Y' ELSE 'N' END AS IS_PK,
+        c.DATA_DEFAULT
+    FROM ALL_TAB_COLUMNS c
+    LEFT JOIN pk_cols pk ON pk.COLUMN_NAME = c.COLUMN_NAME
+    WHERE c.OWNER = ? AND c.TABLE_NAME = ?
+    ORDER BY c.COLUMN_ID
+"""
+
+# Columns of every table, or only of the tables listed
+_DESCRIBE_COLUMNS_SQL = """
+    WITH pk_cols AS (
+        SELECT cols.TABLE_NAME, cols.COLUMN_NAME
+        FROM USER_CONS_COLUMNS cols
+        JOIN USER_CONSTRAINTS cons ON cons.CONSTRAINT_NAME = cols.CONSTRAINT_NAME
+        WHERE cons.CONSTRAINT_TYPE = 'P'
+    )
+    SELECT 
+        c.TABLE_NAME,
+        c.COLUMN_NAME,
+        c.DATA_TYPE,
+        c.NULLABLE,
+        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 'Y' ELSE 'N' END AS IS_PK,
+        c.DATA_DEFAULT
+    FROM USER_TAB_COLUMNS c
+    LEFT JOIN pk_cols pk
+        ON pk.TABLE_NAME = c.TABLE_NAME AND pk.COLUMN_NAME = c.COLUMN_NAME{table_filter}
+    ORDER BY c.TABLE_NAME, c.COLUMN_ID
+"""
+
+_DESCRIBE_SCHEMA_COLUMNS_SQL = """
+    WITH pk_cols AS (
+        SELECT cols.TABLE_NAME, cols.COLUMN_NAME
+        FROM ALL_CONS_COLUMNS cols
+        JOIN ALL_CONSTRAINTS cons
+            ON cons.OWNER = cols.OWNER AND cons.CONSTRAINT_NAME = cols.CONSTRAINT_NAME
+        WHERE cons.CONSTRAINT_TYPE = 'P'
+        AND cons.OWNER = ?
+    )
+    SELECT 
+        c.TABLE_NAME,
+        c.COLUMN_NAME,
+        c.DATA_TYPE,
+        c.NULLABLE,
+        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 'Y' ELSE 'N' END AS IS_PK,
+        c.DATA_DEFAULT
+    FROM ALL_TAB_COLUMNS c
+    LEFT JOIN pk_cols pk
+        ON pk.TABLE_NAME = c.TABLE_NAME AND pk.COLUMN_NAME = c.COLUMN_NAME
+    WHERE c.OWNER = ?{table_filter}
+    ORDER BY c.TABLE_NAME, c.COLUMN_ID
+"""
+
+_DESCRIBE_ALL_TABLES_SQL = _DESCRIBE_COLUMNS_SQL.format(table_filter="")
+_DESCRIBE_ALL_SCHEMA_TABLES_SQL = _DESCRIBE_SCHEMA_COLUMNS_SQL.format(table_filter="")
+
+
+def _describe_tables_sql(count: int, schema: bool) -> str:
+    """The columns query for count tables, named by ? placeholders."""
+    placeholders = ", ".join(["?"] * count)
+    if schema:
+        return _DESCRIBE_SCHEMA_COLUMNS_SQL.format(
+            table_filter=f"\n    AND c.TABLE_NAME IN ({placeholders})"
+        )
+    return _DESCRIBE_COLUMNS_SQL.format(table_filter=f"\n    WHERE c.TABLE_NAME IN ({placeholders})")
+
+
+@functools.lru_cache(maxsize=1)
 def find_dm_jdbc_driver() -> str | None:
-    """Find DM8 JDBC driver path."""
+    """
+    Find DM8 JDBC driver path.
+    
+    The result (including a miss) is memoized for the life of the process;
+    call find_dm_jdbc_driver.cache_clear() to search again.
+    """
+    # An explicit driver path needs a single stat
+    dm_driver = os.environ.get('DM_JDBC_DRIVER')
+    if dm_driver and os.path.isfile(dm_driver):
+        return os.path.normpath(dm_driver)
+    
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
     # 正确的相对路径：从 adapters/ 向上到 src/sqltools_mcp/，再到项目根目录的 assets/
@@ -38,27 +190,110 @@ def find_dm_jdbc_driver() -> str | None:
     if dm_home:
         possible_paths.insert(0, os.path.join(dm_home, "drivers", "jdbc", "DmJdbcDriver18.jar"))
     
-    # Also check environment variable for explicit driver path
-    dm_driver = os.environ.get('DM_JDBC_DRIVER')
-    if dm_driver:
-        possible_paths.insert(0, dm_driver)
-    
     for path in possible_paths:
         normalized_path = os.path.normpath(path)
-        if os.path.exists(normalized_path):
+        if os.path.isfile(normalized_path):
             return normalized_path
     
     return None
 
 
+def _check_alive(conn) -> None:
+    """Health check for pooled connections, raises if the connection is dead."""
+    if not conn.jconn.isValid(5):
+        raise ConnectionError("DM8 connection is no longer valid")
+
+
+def _reset_transaction(conn) -> None:
+    """Roll back pending work before a connection goes back to the pool."""
+    # JDBC drivers reject rollback() while auto-commit is enabled
+    if not conn.jconn.getAutoCommit():
+        conn.rollback()
+
+
+def _read_object(result_set, column: int) -> Any:
+    return result_set.getObject(column)
+
+
+def _fetch_rows(cursor, limit: int | None) -> list[tuple]:
+    """
+    Read up to limit rows straight from a jaydebeapi cursor's ResultSet.
+    
+    jaydebeapi's fetchone() looks up the column count and every column type
+    through JNI again for each row. Here the value readers are resolved once
+    per result set, leaving one JVM call per row plus one per value.
+    """
+    result_set = cursor._rs
+    meta = cursor._meta
+    readers = [
+        cursor._converters.get(meta.getColumnType(column), _read_object)
+        for column in range(1, meta.getColumnCount() + 1)
+    ]
+    result_set.setFetchSize(JDBC_FETCH_SIZE if limit is None else min(limit, JDBC_FETCH_SIZE))
+    
+    rows = []
+    next_row = result_set.next
+    while (limit is None or len(rows) < limit) and next_row():
+        rows.append(tuple([
+            read(result_set, column)
+            for column, read in enumerate(readers, start=1)
+        ]))
+    return rows
+
+
+def _bind_executor(conn) -> Callable[[str, bool, int | None], tuple]:
+    """
+    Bind a connection's methods into a statement runner.
+    
+    Built once per connection checkout so execute_query does not look up
+    the connection and its methods through the adapter on every call. The
+    runner returns (description, rows) for statements that produce a result
+    set, fetching at most max_rows + 1 rows, and (None, affected_rows)
+    otherwise.
+    """
+    cursor_factory = conn.cursor
+    commit = conn.commit
+    
+    def execute(sql: str, is_select: bool, max_rows: int | None) -> tuple:
+        cursor = cursor_factory()
+        cursor.execute(sql)
+        if not is_select:
+            commit()
+            affected = cursor.rowcount
+            cursor.close()
+            return None, affected
+        
+        description = cursor.description or ()
+        # Stop pulling rows over JDBC once max_rows is exceeded
+        rows = _fetch_rows(cursor, None if max_rows is None else max_rows + 1)
+        cursor.close()
+        return description, rows
+    
+    return execute
+
+
+def _columns_by_table(rows: Iterable[Sequence[Any]]) -> dict[str, list[ColumnInfo]]:
+    """Group describe-query rows, led by the table name, into columns per table."""
+    columns_by_table: dict[str, list[ColumnInfo]] = {}
+    for row in rows:
+        columns_by_table.setdefault(row[0], []).append(ColumnInfo(
+            name=row[1],
+            data_type=sys.intern(row[2]),
+            nullable=row[3] == 'Y',
+            is_primary_key=row[4] == 'Y',
+            default_value=row[5]
+        ))
+    return columns_by_table
+
+
 class DM8Adapter(DatabaseAdapter):
     """DM8 (达梦) database adapter."""
     
     def __init__(self):
         super().__init__()
-        if not JAYDEBEAPI_AVAILABLE:
-            raise ImportError("jaydebeapi is not installed. Run: pip install jaydebeapi JPype1")
+        self._execute = None
         self._jdbc_driver_path = None
+        self._statements: OrderedDict[str, Any] = OrderedDict()
     
     @property
     def db_type(self) -> str:
@@ -75,6 +310,12 @@ class DM8Adapter(DatabaseAdapter):
     ) -> dict[str, Any]:
         """Connect to DM8 database."""
         try:
+            # Imported on connect: loading jaydebeapi brings up the JPype bridge
+            try:
+                import jaydebeapi
+            except ImportError:
+                raise ImportError("jaydebeapi is not installed. Run: pip install jaydebeapi JPype1")
+            
             self._jdbc_driver_path = find_dm_jdbc_driver()
             if not self._jdbc_driver_path:
                 raise FileNotFoundError(
@@ -86,48 +327,118 @@ class DM8Adapter(DatabaseAdapter):
             if dbname:
                 jdbc_url += f"/{dbname}"
             
-            self._connection = jaydebeapi.connect(
-                "dm.jdbc.driver.DmDriver",
-                jdbc_url,
-                [username, password],
-                self._jdbc_driver_path
+            driver_path = self._jdbc_driver_path
+            self._pool = get_pool(
+                self.db_type, host, port, username, password, dbname,
+                factory=lambda: jaydebeapi.connect(
+                    "dm.jdbc.driver.DmDriver",
+                    jdbc_url,
+                    [username, password],
+                    driver_path
+                ),
+                validate=_check_alive,
+                reset=_reset_transaction,
             )
+            self._connection = self._pool.acquire()
+            self._execute = _bind_executor(self._connection)
             self._connected = True
             
-            # Get server info
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT BANNER FROM V$VERSION WHERE ROWNUM = 1")
-            version_row = cursor.fetchone()
-            version = version_row[0] if version_row else "Unknown"
-            cursor.execute("SELECT USER FROM DUAL")
-            current_user = cursor.fetchone()[0]
-            cursor.close()
+            # Server info only needs to be fetched once per pool
+            if self._pool.server_info is None:
+                cursor = self._connection.cursor()
+                cursor.execute(
+                    "SELECT (SELECT BANNER FROM V$VERSION WHERE ROWNUM = 1), USER FROM DUAL"
+                )
+                version, current_user = cursor.fetchone()
+                version = version or "Unknown"
+                cursor.close()
+                self._pool.server_info = {
+                    "server_version": version,
+                    "current_user": current_user,
+                }
             
             return {
                 "success": True,
-                "server_version": version,
-                "current_user": current_user,
+                **self._pool.server_info,
                 "host": host,
                 "port": port,
                 "driver": "jaydebeapi (JDBC)",
             }
         except Exception as e:
-            self._connected = False
+            self.disconnect()
             raise ConnectionError(f"DM8 connection failed: {e}")
     
     def disconnect(self) -> None:
-        """Disconnect from DM8 database."""
+        """Return the connection to the pool."""
+        for statement in self._statements.values():
+            try:
+                statement.close()
+            except Exception:
+                pass
+        self._statements.clear()
         if self._connection:
             try:
-                self._connection.close()
+                self._pool.release(self._connection)
             except Exception:
                 pass
             self._connection = None
+        self._execute = None
         self._connected = False
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
     
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
-        """Execute a SQL query."""
-        if not self._connected or not self._connection:
+    def _query_prepared(self, sql: str, *params: str | int) -> list[tuple]:
+        """
+        Run a metadata query through a JDBC prepared statement.
+        
+        Statements are prepared once per connection, up to
+        PREPARED_STATEMENT_CACHE_SIZE of them, and bound with setString/setLong,
+        which sidesteps jaydebeapi's parameter conversion. Column values are
+        returned as Python strings (or None).
+        """
+        statement = self._statements.get(sql)
+        if statement is None:
+            statement = self._connection.jconn.prepareStatement(sql)
+            statement.setFetchSize(JDBC_FETCH_SIZE)
+            self._statements[sql] = statement
+            if len(self._statements) > PREPARED_STATEMENT_CACHE_SIZE:
+                _, evicted = self._statements.popitem(last=False)
+                try:
+                    evicted.close()
+                except Exception:
+                    pass
+        else:
+            self._statements.move_to_end(sql)
+        
+        for index, value in enumerate(params, start=1):
+            if isinstance(value, int):
+                statement.setLong(index, value)
+            else:
+                statement.setString(index, value)
+        
+        result_set = statement.executeQuery()
+        try:
+            column_count = result_set.getMetaData().getColumnCount()
+            rows = []
+            while result_set.next():
+                row = []
+                for index in range(1, column_count + 1):
+                    value = result_set.getString(index)
+                    row.append(str(value) if value is not None else None)
+                rows.append(tuple(row))
+            return rows
+        finally:
+            result_set.close()
+    
+    def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
+        execute = self._execute
+        if execute is None:
             return QueryResult(
                 success=False,
                 error="Not connected to database",
@@ -135,165 +446,246 @@ class DM8Adapter(DatabaseAdapter):
             )
         
         try:
-            cursor = self._connection.cursor()
-            cursor.execute(sql)
-            
             # Check if it's a SELECT query
-            sql_upper = sql.strip().upper()
-            is_select = (
-                sql_upper.startswith("SELECT") or
-                sql_upper.startswith("WITH") or
-                sql_upper.startswith("SHOW") or
-                sql_upper.startswith("DESCRIBE") or
-                sql_upper.startswith("EXPLAIN")
-            )
+            keyword = first_keyword(sql)
+            is_select = keyword in _SELECT_KEYWORDS
             
-            if is_select:
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                raw_rows = cursor.fetchall()
-                rows = []
-                for row in raw_rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        # Handle special types
-                        if isinstance(value, Decimal):
-                            value = float(value)
-                        elif isinstance(value, (datetime, date)):
-                            value = value.isoformat()
-                        elif isinstance(value, timedelta):
-                            value = str(value)
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='replace')
-                        row_dict[col] = value
-                    rows.append(row_dict)
-                
-                cursor.close()
+            description, fetched = execute(sql, is_select, max_rows)
+            if not is_select:
+                if keyword in DDL_KEYWORDS:
+                    self._metadata_cache.invalidate()
+                    self._description_cache.clear()
                 return QueryResult(
                     success=True,
-                    columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                    message=f"Query successful, returned {len(rows)} rows"
+                    affected_rows=fetched,
+                    message=f"Execution successful, affected {fetched} rows"
                 )
+            
+            truncated = max_rows is not None and len(fetched) > max_rows
+            if truncated:
+                del fetched[max_rows:]
+            
+            # Reuse the column names and converters from an earlier run of
+            # the same statement while its result layout is unchanged
+            cached = self._description_cache.get(sql)
+            if cached is not None and cached[0] == description:
+                _, columns, converters = cached
             else:
-                self._connection.commit()
-                affected = cursor.rowcount
-                cursor.close()
-                return QueryResult(
-                    success=True,
-                    affected_rows=affected,
-                    message=f"Execution successful, affected {affected} rows"
-                )
+                columns = tuple(sys.intern(desc[0]) for desc in description)
+                converters = None
+            
+            if converters is None and fetched:
+                converters = build_converters(fetched)
+            data = convert_rows(fetched, converters) if fetched else []
+            
+            if converters is not None:
+                self._description_cache.set(sql, (description, columns, converters))
+            message = f"Query successful, returned {len(data)} rows"
+            if truncated:
+                message += f" (truncated to max_rows={max_rows})"
+            return QueryResult(
+                success=True,
+                columns=columns,
+                data=data,
+                row_count=len(data),
+                message=message,
+                truncated=truncated
+            )
+        except Exception as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+    
+    def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute sql once per parameter set (? placeholders).
+        
+        jaydebeapi sends the sets as one JDBC batch (addBatch/executeBatch).
+        """
+        if not self._connected or not self._connection:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.executemany(sql, params_batch)
+            self._connection.commit()
+            affected = cursor.rowcount
+            cursor.close()
         except Exception as e:
+            try:
+                _reset_transaction(self._connection)
+            except Exception:
+                pass
             return QueryResult(
                 success=False,
                 error=str(e),
                 message="SQL execution failed"
             )
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
     
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
-        """List all tables in the database."""
+    def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
         if not self._connected:
             return []
         
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
         try:
-            cursor = self._connection.cursor()
+            row_limit = _NO_LIMIT if limit is None else limit
             if schema:
-                # Query with specific schema using Oracle-compatible ALL_TABLES
-                # Using string formatting due to jaydebeapi parameter binding issues
-                safe_schema = schema.upper().replace("'", "''")
-                cursor.execute(f"""
-                    SELECT TABLE_NAME, 'TABLE' AS TABLE_TYPE
-                    FROM ALL_TABLES
-                    WHERE OWNER = '{safe_schema}'
-                    ORDER BY TABLE_NAME
-                """)
+                rows = self._query_prepared(_LIST_SCHEMA_TABLES_SQL, schema.upper(), row_limit, offset)
             else:
-                # Query current user's tables
-                cursor.execute("""
-                    SELECT TABLE_NAME, 'TABLE' AS TABLE_TYPE
-                    FROM USER_TABLES
-                    ORDER BY TABLE_NAME
-                """)
+                rows = self._query_prepared(_LIST_TABLES_SQL, row_limit, offset)
             
-            tables = []
-            for row in cursor.fetchall():
-                tables.append(TableInfo(
+            tables = [
+                TableInfo(
                     name=row[0],
                     schema=schema,
-                    table_type=row[1] if len(row) > 1 else "TABLE"
-                ))
+                    table_type=sys.intern(row[1]) if len(row) > 1 else "TABLE"
+                )
+                for row in rows
+            ]
             
-            cursor.close()
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
             return tables
         except Exception:
             return []
     
+    def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            if schema:
+                rows = self._query_prepared(_COUNT_SCHEMA_TABLES_SQL, schema.upper())
+            else:
+                rows = self._query_prepared(_COUNT_TABLES_SQL)
+            count = int(rows[0][0])
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except Exception:
+            return 0
+    
     def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """Get table structure."""
         if not self._connected:
             return []
         
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            cursor = self._connection.cursor()
-            # Safe escaping for string formatting
-            safe_table = table_name.upper().replace("'", "''")
-            
             if schema:
-                safe_schema = schema.upper().replace("'", "''")
-                # Use Oracle-compatible ALL_TAB_COLUMNS with string formatting
-                cursor.execute(f"""
-                    SELECT 
-                        c.COLUMN_NAME,
-                        c.DATA_TYPE,
-                        c.NULLABLE,
-                        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 'Y' ELSE 'N' END AS IS_PK,
-                        c.DATA_DEFAULT
-                    FROM ALL_TAB_COLUMNS c
-                    LEFT JOIN (
-                        SELECT cols.COLUMN_NAME
-                        FROM ALL_CONSTRAINTS cons
-                        JOIN ALL_CONS_COLUMNS cols ON cons.CONSTRAINT_NAME = cols.CONSTRAINT_NAME
-                        WHERE cons.CONSTRAINT_TYPE = 'P'
-                        AND cons.OWNER = '{safe_schema}'
-                        AND cons.TABLE_NAME = '{safe_table}'
-                    ) pk ON c.COLUMN_NAME = pk.COLUMN_NAME
-                    WHERE c.OWNER = '{safe_schema}' AND c.TABLE_NAME = '{safe_table}'
-                    ORDER BY c.COLUMN_ID
-                """)
+                rows = self._query_prepared(
+                    _DESCRIBE_SCHEMA_TABLE_SQL,
+                    schema.upper(), table_name.upper(), schema.upper(), table_name.upper()
+                )
             else:
-                # Use Oracle-compatible USER_TAB_COLUMNS with string formatting
-                cursor.execute(f"""
-                    SELECT 
-                        c.COLUMN_NAME,
-                        c.DATA_TYPE,
-                        c.NULLABLE,
-                        CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 'Y' ELSE 'N' END AS IS_PK,
-                        c.DATA_DEFAULT
-                    FROM USER_TAB_COLUMNS c
-                    LEFT JOIN (
-                        SELECT cols.COLUMN_NAME
-                        FROM USER_CONSTRAINTS cons
-                        JOIN USER_CONS_COLUMNS cols ON cons.CONSTRAINT_NAME = cols.CONSTRAINT_NAME
-                        WHERE cons.CONSTRAINT_TYPE = 'P'
-                        AND cons.TABLE_NAME = '{safe_table}'
-                    ) pk ON c.COLUMN_NAME = pk.COLUMN_NAME
-                    WHERE c.TABLE_NAME = '{safe_table}'
-                    ORDER BY c.COLUMN_ID
-                """)
+                rows = self._query_prepared(
+                    _DESCRIBE_TABLE_SQL, table_name.upper(), table_name.upper()
+                )
             
-            columns = []
-            for row in cursor.fetchall():
-                columns.append(ColumnInfo(
+            columns = [
+                ColumnInfo(
                     name=row[0],
-                    data_type=row[1],
+                    data_type=sys.intern(row[1]),
                     nullable=row[2] == 'Y',
                     is_primary_key=row[3] == 'Y',
                     default_value=row[4]
-                ))
+                )
+                for row in rows
+            ]
             
-            cursor.close()
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
             return columns
         except Exception:
             return []
+    
+    def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in a schema."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            if schema:
+                rows = self._query_prepared(
+                    _DESCRIBE_ALL_SCHEMA_TABLES_SQL, schema.upper(), schema.upper()
+                )
+            else:
+                rows = self._query_prepared(_DESCRIBE_ALL_TABLES_SQL)
+            
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except Exception:
+            return {}
+    
+    def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            # Looked up in upper case, like describe_table, but reported
+            # under the names asked for
+            requested = {name.upper(): name for name in missing}
+            sql = _describe_tables_sql(len(requested), bool(schema))
+            if schema:
+                rows = self._query_prepared(sql, schema.upper(), schema.upper(), *requested)
+            else:
+                rows = self._query_prepared(sql, *requested)
+            columns_by_table = {
+                requested[table_name]: columns
+                for table_name, columns in _columns_by_table(rows).items()
+            }
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except Exception:
+            return found
@@ -3,42 +3,71 @@
 Creates the appropriate database adapter based on database type.
 """
 
+import importlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .base import DatabaseAdapter
+    from .base import DatabaseAdapter, AsyncDatabaseAdapter
 
 
-def get_adapter(dbtype: str) -> "DatabaseAdapter":
+# Database type (including aliases) -> (adapter module, adapter class)
+_REGISTRY: dict[str, tuple[str, str]] = {
+    "mysql": (".mysql", "MySQLAdapter"),
+    "postgres": (".postgres", "PostgresAdapter"),
+    "postgresql": (".postgres", "PostgresAdapter"),
+    "mssql": (".mssql", "MSSQLAdapter"),
+    "sqlserver": (".mssql", "MSSQLAdapter"),
+    "dm8": (".dm8", "DM8Adapter"),
+    "dameng": (".dm8", "DM8Adapter"),
+    "sqlite": (".sqlite", "SQLiteAdapter"),
+}
+
+_ASYNC_REGISTRY: dict[str, tuple[str, str]] = {
+    "mysql": (".mysql_async", "AsyncMySQLAdapter"),
+    "postgres": (".postgres_async", "AsyncPostgresAdapter"),
+    "postgresql": (".postgres_async", "AsyncPostgresAdapter"),
+    "mssql": (".mssql_async", "AsyncMSSQLAdapter"),
+    "sqlserver": (".mssql_async", "AsyncMSSQLAdapter"),
+}
+
+_SUPPORTED = ["mysql", "postgres", "mssql", "dm8", "sqlite"]
+_ASYNC_SUPPORTED = ["mysql", "postgres", "mssql"]
+
+# (async_, database type) -> adapter class, resolved on first use
+_class_cache: dict[tuple[bool, str], type] = {}
+
+
+def get_adapter(dbtype: str, async_: bool = False) -> "DatabaseAdapter | AsyncDatabaseAdapter":
     """
     Get a database adapter instance for the specified database type.
     
+    Adapter modules are imported the first time their type is requested,
+    so only the drivers actually in use get loaded.
+    
     Args:
         dbtype: Database type (mysql, postgres, mssql, dm8, sqlite)
+        async_: Return the asyncio adapter (mysql, postgres and mssql only)
         
     Returns:
-        DatabaseAdapter instance
+        DatabaseAdapter instance, or AsyncDatabaseAdapter if async_ is set
         
     Raises:
         ValueError: If database type is not supported
     """
     dbtype = dbtype.lower()
     
-    if dbtype == "mysql":
-        from .mysql import MySQLAdapter
-        return MySQLAdapter()
-    elif dbtype == "postgres" or dbtype == "postgresql":
-        from .postgres import PostgresAdapter
-        return PostgresAdapter()
-    elif dbtype == "mssql" or dbtype == "sqlserver":
-        from .mssql import MSSQLAdapter
-        return MSSQLAdapter()
-    elif dbtype == "dm8" or dbtype == "dameng":
-        from .dm8 import DM8Adapter
-        return DM8Adapter()
-    elif dbtype == "sqlite":
-        from .sqlite import SQLiteAdapter
-        return SQLiteAdapter()
-    else:
-        supported = ["mysql", "postgres", "mssql", "dm8", "sqlite"]
-        raise ValueError(f"Unsupported database type: {dbtype}. Supported types: {supported}")
+    adapter_class = _class_cache.get((async_, dbtype))
+    if adapter_class is None:
+        registry = _ASYNC_REGISTRY if async_ else _REGISTRY
+        try:
+            module_name, class_name = registry[dbtype]
+        except KeyError:
+            if async_:
+                raise ValueError(
+                    f"No async adapter for database type: {dbtype}. Supported types: {_ASYNC_SUPPORTED}"
+                ) from None
+            raise ValueError(f"Unsupported database type: {dbtype}. Supported types: {_SUPPORTED}") from None
+        module = importlib.import_module(module_name, __package__)
+        adapter_class = _class_cache.setdefault((async_, dbtype), getattr(module, class_name))
+    
+    return adapter_class()
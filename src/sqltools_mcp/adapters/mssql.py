@@ -1,16 +1,196 @@
 """SQL Server (MSSQL) database adapter using pymssql."""
 
-from typing import Any
-from decimal import Decimal
-from datetime import datetime, date, timedelta
+import sys
+from typing import Any, Callable, Iterable, Sequence
 
-from .base import DatabaseAdapter, TableInfo, ColumnInfo, QueryResult
+from .base import (
+    DatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+    get_pool,
+)
 
-try:
-    import pymssql
-    PYMSSQL_AVAILABLE = True
-except ImportError:
-    PYMSSQL_AVAILABLE = False
+# Leading keywords of statements that return a result set
+_SELECT_KEYWORDS = frozenset({"SELECT", "EXEC", "EXECUTE", "WITH"})
+
+# Rows fetched per round-trip when reading result sets
+FETCH_BATCH_SIZE = 1000
+
+
+def _param_declaration(param: str) -> str:
+    """Declaration of a metadata query parameter, "name" or "name type"."""
+    name, _, type_name = param.partition(" ")
+    return f"{name} {type_name or 'sysname'}"
+
+
+def _sp_executesql(sql: str, *params: str) -> str:
+    """
+    Wrap a statement using @params in an sp_executesql call.
+    
+    pymssql interpolates parameters client-side, so each table name would
+    otherwise produce a new ad-hoc batch with its own plan. Passing the
+    values as sp_executesql parameters lets SQL Server reuse one cached plan.
+    """
+    statement = sql.replace("'", "''")
+    declarations = ", ".join(f"@{_param_declaration(param)}" for param in params)
+    assignments = ", ".join(f"@{param.partition(' ')[0]} = %s" for param in params)
+    return f"EXEC sp_executesql N'{statement}', N'{declarations}', {assignments}"
+
+
+# Metadata queries, written against @schema/@table parameters
+_LIST_TABLES_QUERY = """
+    SELECT 
+        t.TABLE_NAME,
+        t.TABLE_TYPE,
+        p.rows
+    FROM INFORMATION_SCHEMA.TABLES t
+    LEFT JOIN sys.partitions p ON p.object_id = OBJECT_ID(t.TABLE_SCHEMA + '.' + t.TABLE_NAME) AND p.index_id IN (0, 1)
+    WHERE t.TABLE_SCHEMA = @schema
+    ORDER BY t.TABLE_NAME
+    OFFSET @offset ROWS FETCH NEXT @limit ROWS ONLY
+"""
+
+_COUNT_TABLES_QUERY = """
+    SELECT COUNT(*)
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA = @schema
+"""
+
+# FETCH NEXT needs a row count; the largest bigint stands in for "all"
+_NO_LIMIT = 9223372036854775807
+
+# Read from the sys catalog views directly; the INFORMATION_SCHEMA views
+# wrap them in extra joins and filters that make lookups much slower
+_DESCRIBE_TABLE_QUERY = """
+    SELECT 
+        c.name,
+        t.name,
+        c.is_nullable,
+        CASE WHEN pk.column_id IS NOT NULL THEN 1 ELSE 0 END AS is_primary_key,
+        dc.definition
+    FROM sys.columns c
+    JOIN sys.types t ON t.user_type_id = c.user_type_id
+    LEFT JOIN (
+        SELECT ic.object_id, ic.column_id
+        FROM sys.indexes i
+        JOIN sys.index_columns ic
+            ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        WHERE i.is_primary_key = 1
+    ) pk ON pk.object_id = c.object_id AND pk.column_id = c.column_id
+    LEFT JOIN sys.default_constraints dc
+        ON dc.parent_object_id = c.object_id AND dc.parent_column_id = c.column_id
+    WHERE c.object_id = OBJECT_ID(QUOTENAME(@schema) + '.' + QUOTENAME(@table))
+    ORDER BY c.column_id
+"""
+
+# Columns of every table in a schema, or only of the tables listed
+_DESCRIBE_COLUMNS_QUERY = """
+    SELECT 
+        o.name,
+        c.name,
+        t.name,
+        c.is_nullable,
+        CASE WHEN pk.column_id IS NOT NULL THEN 1 ELSE 0 END AS is_primary_key,
+        dc.definition
+    FROM sys.objects o
+    JOIN sys.columns c ON c.object_id = o.object_id
+    JOIN sys.types t ON t.user_type_id = c.user_type_id
+    LEFT JOIN (
+        SELECT ic.object_id, ic.column_id
+        FROM sys.indexes i
+        JOIN sys.index_columns ic
+            ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        WHERE i.is_primary_key = 1
+    ) pk ON pk.object_id = c.object_id AND pk.column_id = c.column_id
+    LEFT JOIN sys.default_constraints dc
+        ON dc.parent_object_id = c.object_id AND dc.parent_column_id = c.column_id
+    WHERE o.schema_id = SCHEMA_ID(@schema) AND o.type IN ('U', 'V'){table_filter}
+    ORDER BY o.name, c.column_id
+"""
+
+_DESCRIBE_SCHEMA_QUERY = _DESCRIBE_COLUMNS_QUERY.format(table_filter="")
+
+
+def _describe_tables_query(count: int) -> tuple[str, list[str]]:
+    """The columns query for count tables, and the names of their @params."""
+    params = [f"table{index}" for index in range(count)]
+    table_filter = "\n    AND o.name IN (" + ", ".join(f"@{name}" for name in params) + ")"
+    return _DESCRIBE_COLUMNS_QUERY.format(table_filter=table_filter), params
+
+_LIST_TABLES_SQL = _sp_executesql(_LIST_TABLES_QUERY, "schema", "offset bigint", "limit bigint")
+_COUNT_TABLES_SQL = _sp_executesql(_COUNT_TABLES_QUERY, "schema")
+_DESCRIBE_TABLE_SQL = _sp_executesql(_DESCRIBE_TABLE_QUERY, "schema", "table")
+_DESCRIBE_SCHEMA_SQL = _sp_executesql(_DESCRIBE_SCHEMA_QUERY, "schema")
+
+
+def _check_alive(conn) -> None:
+    """Health check for pooled connections, raises if the connection is dead."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1")
+    cursor.fetchall()
+    cursor.close()
+
+
+def _bind_executor(conn) -> Callable[[str, bool, int | None], tuple]:
+    """
+    Bind a connection's methods into a statement runner.
+    
+    Built once per connection checkout so execute_query does not look up
+    the connection and its methods through the adapter on every call. The
+    runner returns (description, rows) for statements that produce a result
+    set, fetching at most max_rows + 1 rows, and (None, affected_rows)
+    otherwise.
+    """
+    cursor_factory = conn.cursor
+    commit = conn.commit
+    
+    def execute(sql: str, is_select: bool, max_rows: int | None) -> tuple:
+        cursor = cursor_factory()
+        cursor.execute(sql)
+        if not is_select:
+            commit()
+            affected = cursor.rowcount
+            cursor.close()
+            return None, affected
+        
+        description = cursor.description or ()
+        rows = []
+        # Pull rows in batches rather than materializing the whole set, and
+        # no more than the max_rows + 1 that tell whether it was cut short
+        while description:
+            if max_rows is None:
+                batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+            else:
+                batch = cursor.fetchmany(min(FETCH_BATCH_SIZE, max_rows + 1 - len(rows)))
+            if not batch:
+                break
+            rows.extend(batch)
+            if max_rows is not None and len(rows) > max_rows:
+                break
+        cursor.close()
+        return description, rows
+    
+    return execute
+
+
+def _columns_by_table(rows: Iterable[Sequence[Any]]) -> dict[str, list[ColumnInfo]]:
+    """Group describe-query rows, led by the table name, into columns per table."""
+    columns_by_table: dict[str, list[ColumnInfo]] = {}
+    for row in rows:
+        columns_by_table.setdefault(row[0], []).append(ColumnInfo(
+            name=row[1],
+            data_type=sys.intern(row[2]),
+            nullable=bool(row[3]),
+            is_primary_key=bool(row[4]),
+            default_value=row[5]
+        ))
+    return columns_by_table
 
 
 class MSSQLAdapter(DatabaseAdapter):
@@ -18,8 +198,13 @@ class MSSQLAdapter(DatabaseAdapter):
     
     def __init__(self):
         super().__init__()
-        if not PYMSSQL_AVAILABLE:
+        self._execute = None
+        # Imported here so only the adapter in use pays for its driver
+        try:
+            import pymssql
+        except ImportError:
             raise ImportError("pymssql is not installed. Run: pip install pymssql")
+        self._driver = pymssql
     
     @property
     def db_type(self) -> str:
@@ -36,51 +221,67 @@ class MSSQLAdapter(DatabaseAdapter):
     ) -> dict[str, Any]:
         """Connect to SQL Server database."""
         try:
-            self._connection = pymssql.connect(
-                server=host,
-                port=port,
-                user=username,
-                password=password,
-                database=dbname,
-                login_timeout=10
+            driver = self._driver
+            self._pool = get_pool(
+                self.db_type, host, port, username, password, dbname,
+                factory=lambda: driver.connect(
+                    server=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    database=dbname,
+                    login_timeout=10
+                ),
+                validate=_check_alive,
             )
+            self._connection = self._pool.acquire()
+            self._execute = _bind_executor(self._connection)
             self._connected = True
             
-            # Get server info
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT @@VERSION")
-            version = cursor.fetchone()[0]
-            cursor.execute("SELECT DB_NAME()")
-            current_db = cursor.fetchone()[0]
-            cursor.execute("SELECT SYSTEM_USER")
-            current_user = cursor.fetchone()[0]
-            cursor.close()
+            # Server info only needs to be fetched once per pool
+            if self._pool.server_info is None:
+                cursor = self._connection.cursor()
+                cursor.execute("SELECT @@VERSION, DB_NAME(), SYSTEM_USER")
+                version, current_db, current_user = cursor.fetchone()
+                cursor.close()
+                self._pool.server_info = {
+                    "server_version": version,
+                    "current_database": current_db,
+                    "current_user": current_user,
+                }
             
             return {
                 "success": True,
-                "server_version": version,
-                "current_database": current_db,
-                "current_user": current_user,
+                **self._pool.server_info,
                 "host": host,
                 "port": port,
             }
-        except pymssql.Error as e:
-            self._connected = False
+        except (self._driver.Error, TimeoutError) as e:
+            self.disconnect()
             raise ConnectionError(f"SQL Server connection failed: {e}")
     
     def disconnect(self) -> None:
-        """Disconnect from SQL Server database."""
+        """Return the connection to the pool."""
         if self._connection:
             try:
-                self._connection.close()
+                self._pool.release(self._connection)
             except Exception:
                 pass
             self._connection = None
+        self._execute = None
         self._connected = False
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
     
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
-        """Execute a SQL query."""
-        if not self._connected or not self._connection:
+    def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
+        execute = self._execute
+        if execute is None:
             return QueryResult(
                 success=False,
                 error="Not connected to database",
@@ -88,135 +289,229 @@ class MSSQLAdapter(DatabaseAdapter):
             )
         
         try:
-            cursor = self._connection.cursor(as_dict=True)
-            cursor.execute(sql)
-            
             # Check if it's a SELECT query
-            sql_upper = sql.strip().upper()
-            is_select = (
-                sql_upper.startswith("SELECT") or
-                sql_upper.startswith("EXEC") or
-                sql_upper.startswith("SP_") or
-                sql_upper.startswith("WITH")
-            )
+            keyword = first_keyword(sql)
+            is_select = keyword in _SELECT_KEYWORDS or keyword.startswith("SP_")
             
-            if is_select:
-                raw_rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                rows = []
-                for row in raw_rows:
-                    row_dict = {}
-                    for col in row:
-                        value = row[col]
-                        # Handle special types
-                        if isinstance(value, Decimal):
-                            value = float(value)
-                        elif isinstance(value, (datetime, date)):
-                            value = value.isoformat()
-                        elif isinstance(value, timedelta):
-                            value = str(value)
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='replace')
-                        row_dict[col] = value
-                    rows.append(row_dict)
-                
-                cursor.close()
+            description, fetched = execute(sql, is_select, max_rows)
+            if not is_select:
+                if keyword in DDL_KEYWORDS:
+                    self._metadata_cache.invalidate()
+                    self._description_cache.clear()
                 return QueryResult(
                     success=True,
-                    columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                    message=f"Query successful, returned {len(rows)} rows"
+                    affected_rows=fetched,
+                    message=f"Execution successful, affected {fetched} rows"
                 )
+            
+            truncated = max_rows is not None and len(fetched) > max_rows
+            if truncated:
+                del fetched[max_rows:]
+            
+            # Reuse the column names and converters from an earlier run of
+            # the same statement while its result layout is unchanged
+            cached = self._description_cache.get(sql)
+            if cached is not None and cached[0] == description:
+                _, columns, converters = cached
             else:
-                self._connection.commit()
-                affected = cursor.rowcount
-                cursor.close()
-                return QueryResult(
-                    success=True,
-                    affected_rows=affected,
-                    message=f"Execution successful, affected {affected} rows"
-                )
-        except pymssql.Error as e:
+                columns = tuple(sys.intern(desc[0]) for desc in description)
+                converters = None
+            
+            if converters is None and fetched:
+                converters = build_converters(fetched)
+            data = convert_rows(fetched, converters) if fetched else []
+            
+            if converters is not None:
+                self._description_cache.set(sql, (description, columns, converters))
+            message = f"Query successful, returned {len(data)} rows"
+            if truncated:
+                message += f" (truncated to max_rows={max_rows})"
+            return QueryResult(
+                success=True,
+                columns=columns,
+                data=data,
+                row_count=len(data),
+                message=message,
+                truncated=truncated
+            )
+        except self._driver.Error as e:
             return QueryResult(
                 success=False,
                 error=str(e),
                 message="SQL execution failed"
             )
     
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
-        """List all tables in the database."""
+    def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """Execute sql once per parameter set (%s placeholders), in one transaction."""
+        if not self._connected or not self._connection:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.executemany(sql, params_batch)
+            self._connection.commit()
+            affected = cursor.rowcount
+            cursor.close()
+        except self._driver.Error as e:
+            self._connection.rollback()
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
+    
+    def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
         if not self._connected:
             return []
         
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
         try:
             cursor = self._connection.cursor()
             schema_filter = schema if schema else 'dbo'
-            cursor.execute("""
-                SELECT 
-                    t.TABLE_NAME,
-                    t.TABLE_TYPE,
-                    p.rows
-                FROM INFORMATION_SCHEMA.TABLES t
-                LEFT JOIN sys.partitions p ON p.object_id = OBJECT_ID(t.TABLE_SCHEMA + '.' + t.TABLE_NAME) AND p.index_id IN (0, 1)
-                WHERE t.TABLE_SCHEMA = %s
-                ORDER BY t.TABLE_NAME
-            """, (schema_filter,))
+            cursor.execute(
+                _LIST_TABLES_SQL,
+                (schema_filter, offset, _NO_LIMIT if limit is None else limit)
+            )
             
-            tables = []
-            for row in cursor.fetchall():
-                tables.append(TableInfo(
+            tables = [
+                TableInfo(
                     name=row[0],
                     schema=schema_filter,
-                    table_type=row[1] if row[1] else "TABLE",
+                    table_type=sys.intern(row[1]) if row[1] else "TABLE",
                     row_count=row[2] if row[2] else None
-                ))
+                )
+                for row in cursor
+            ]
             
             cursor.close()
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
             return tables
-        except pymssql.Error:
+        except self._driver.Error:
             return []
     
+    def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._connection.cursor()
+            schema_filter = schema if schema else 'dbo'
+            cursor.execute(_COUNT_TABLES_SQL, (schema_filter,))
+            count = cursor.fetchone()[0]
+            cursor.close()
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except self._driver.Error:
+            return 0
+    
     def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """Get table structure."""
         if not self._connected:
             return []
         
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             cursor = self._connection.cursor()
             schema_filter = schema if schema else 'dbo'
-            cursor.execute("""
-                SELECT 
-                    c.COLUMN_NAME,
-                    c.DATA_TYPE,
-                    c.IS_NULLABLE,
-                    CASE WHEN pk.COLUMN_NAME IS NOT NULL THEN 1 ELSE 0 END AS IS_PRIMARY_KEY,
-                    c.COLUMN_DEFAULT
-                FROM INFORMATION_SCHEMA.COLUMNS c
-                LEFT JOIN (
-                    SELECT ku.COLUMN_NAME
-                    FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                    JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE ku
-                        ON tc.CONSTRAINT_NAME = ku.CONSTRAINT_NAME
-                    WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-                    AND tc.TABLE_SCHEMA = %s
-                    AND tc.TABLE_NAME = %s
-                ) pk ON c.COLUMN_NAME = pk.COLUMN_NAME
-                WHERE c.TABLE_SCHEMA = %s AND c.TABLE_NAME = %s
-                ORDER BY c.ORDINAL_POSITION
-            """, (schema_filter, table_name, schema_filter, table_name))
+            cursor.execute(_DESCRIBE_TABLE_SQL, (schema_filter, table_name))
             
-            columns = []
-            for row in cursor.fetchall():
-                columns.append(ColumnInfo(
+            columns = [
+                ColumnInfo(
                     name=row[0],
-                    data_type=row[1],
-                    nullable=row[2] == 'YES',
+                    data_type=sys.intern(row[1]),
+                    nullable=bool(row[2]),
                     is_primary_key=bool(row[3]),
                     default_value=row[4]
-                ))
+                )
+                for row in cursor
+            ]
             
             cursor.close()
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
             return columns
-        except pymssql.Error:
+        except self._driver.Error:
             return []
+    
+    def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in a schema."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._connection.cursor()
+            schema_filter = schema if schema else 'dbo'
+            cursor.execute(_DESCRIBE_SCHEMA_SQL, (schema_filter,))
+            
+            columns_by_table = _columns_by_table(cursor)
+            
+            cursor.close()
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except self._driver.Error:
+            return {}
+    
+    def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            schema_filter = schema if schema else 'dbo'
+            query, params = _describe_tables_query(len(missing))
+            cursor = self._connection.cursor()
+            cursor.execute(_sp_executesql(query, "schema", *params), (schema_filter, *missing))
+            columns_by_table = _columns_by_table(cursor)
+            cursor.close()
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except self._driver.Error:
+            return found
@@ -0,0 +1,416 @@
+"""Asynchronous SQL Server database adapter using aioodbc."""
+
+import os
+import re
+import sys
+from typing import Any, Sequence
+
+from .base import (
+    AsyncDatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+)
+from ..config import POOL_MIN_SIZE, POOL_MAX_SIZE
+from .mssql import (
+    _SELECT_KEYWORDS,
+    _LIST_TABLES_QUERY,
+    _COUNT_TABLES_QUERY,
+    _DESCRIBE_TABLE_QUERY,
+    _DESCRIBE_SCHEMA_QUERY,
+    _NO_LIMIT,
+    _param_declaration,
+    _columns_by_table,
+    _describe_tables_query,
+)
+
+# ODBC driver used unless MSSQL_ODBC_DRIVER names another one
+DEFAULT_ODBC_DRIVER = "ODBC Driver 18 for SQL Server"
+
+# Accept the server's certificate without validating it; off unless
+# MSSQL_TRUST_SERVER_CERTIFICATE=1, e.g. for servers with self-signed ones
+TRUST_SERVER_CERTIFICATE = os.getenv("MSSQL_TRUST_SERVER_CERTIFICATE", "0") == "1"
+
+
+def _bind_params(sql: str, *params: str) -> str:
+    """
+    Bind the @params of a metadata query to ODBC ? placeholders.
+    
+    pyodbc sends parameters with sp_prepexec, so the statement is prepared
+    on the server and its plan reused across table names.
+    """
+    declarations = "".join(f"DECLARE @{_param_declaration(param)} = ?;\n" for param in params)
+    return "SET NOCOUNT ON;\n" + declarations + sql
+
+
+_LIST_TABLES_SQL = _bind_params(_LIST_TABLES_QUERY, "schema", "offset bigint", "limit bigint")
+_COUNT_TABLES_SQL = _bind_params(_COUNT_TABLES_QUERY, "schema")
+_DESCRIBE_TABLE_SQL = _bind_params(_DESCRIBE_TABLE_QUERY, "schema", "table")
+_DESCRIBE_SCHEMA_SQL = _bind_params(_DESCRIBE_SCHEMA_QUERY, "schema")
+
+# %s placeholders, skipping string literals and quoted identifiers
+_PLACEHOLDER_RE = re.compile(r"'(?:[^']|'')*'|\[[^\]]*\]|%s")
+
+
+def _qmark(sql: str) -> str:
+    """Turn the %s placeholders used with pymssql into ODBC ? markers."""
+    return _PLACEHOLDER_RE.sub(lambda match: "?" if match.group() == "%s" else match.group(), sql)
+
+
+def _odbc_value(value: Any) -> str:
+    """Quote a connection string value so ; and } are taken literally."""
+    return "{" + str(value).replace("}", "}}") + "}"
+
+
+class AsyncMSSQLAdapter(AsyncDatabaseAdapter):
+    """Asynchronous SQL Server database adapter."""
+    
+    def __init__(self):
+        super().__init__()
+        try:
+            import aioodbc
+            import pyodbc
+        except ImportError:
+            raise ImportError("aioodbc is not installed. Run: pip install aioodbc")
+        self._odbc_driver = os.environ.get('MSSQL_ODBC_DRIVER', DEFAULT_ODBC_DRIVER)
+        if self._odbc_driver not in pyodbc.drivers():
+            # Raised as ImportError so that the pymssql adapter is used instead
+            raise ImportError(f"ODBC driver '{self._odbc_driver}' is not installed")
+        self._driver = aioodbc
+        self._error = pyodbc.Error
+    
+    @property
+    def db_type(self) -> str:
+        return "mssql"
+    
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        dbname: str,
+        **kwargs
+    ) -> dict[str, Any]:
+        """Connect to SQL Server database."""
+        dsn = ";".join([
+            f"DRIVER={_odbc_value(self._odbc_driver)}",
+            f"SERVER={host},{port}",
+            f"DATABASE={_odbc_value(dbname)}",
+            f"UID={_odbc_value(username)}",
+            f"PWD={_odbc_value(password)}",
+            f"TrustServerCertificate={'yes' if TRUST_SERVER_CERTIFICATE else 'no'}",
+            "LoginTimeout=10",
+        ])
+        
+        try:
+            self._pool = await self._driver.create_pool(
+                dsn=dsn,
+                minsize=POOL_MIN_SIZE,
+                maxsize=POOL_MAX_SIZE,
+                autocommit=True
+            )
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT @@VERSION, DB_NAME(), SYSTEM_USER")
+                    version, current_db, current_user = await cursor.fetchone()
+            self._connected = True
+            
+            return {
+                "success": True,
+                "server_version": version,
+                "current_database": current_db,
+                "current_user": current_user,
+                "host": host,
+                "port": port,
+            }
+        except self._error as e:
+            await self.disconnect()
+            raise ConnectionError(f"SQL Server connection failed: {e}")
+    
+    async def disconnect(self) -> None:
+        """Close the connection pool."""
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+        self._connected = False
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
+    
+    async def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
+        if not self._connected:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        # Check if it's a SELECT query
+        keyword = first_keyword(sql)
+        is_select = keyword in _SELECT_KEYWORDS or keyword.startswith("SP_")
+        
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(sql)
+                    
+                    if not is_select:
+                        affected = cursor.rowcount
+                        if keyword in DDL_KEYWORDS:
+                            self._metadata_cache.invalidate()
+                            self._description_cache.clear()
+                        return QueryResult(
+                            success=True,
+                            affected_rows=affected,
+                            message=f"Execution successful, affected {affected} rows"
+                        )
+                    
+                    description = cursor.description or ()
+                    if not description:
+                        raw_rows = []
+                    elif max_rows is None:
+                        raw_rows = await cursor.fetchall()
+                    else:
+                        # One extra row tells us whether the result was cut short
+                        raw_rows = await cursor.fetchmany(max_rows + 1)
+            
+            truncated = max_rows is not None and len(raw_rows) > max_rows
+            if truncated:
+                del raw_rows[max_rows:]
+            
+            cached = self._description_cache.get(sql)
+            if cached is not None and cached[0] == description:
+                _, columns, converters = cached
+            else:
+                columns = tuple(sys.intern(desc[0]) for desc in description)
+                converters = None
+            
+            if converters is None and raw_rows:
+                converters = build_converters(raw_rows)
+            data = convert_rows(raw_rows, converters) if raw_rows else []
+            
+            if converters is not None:
+                self._description_cache.set(sql, (description, columns, converters))
+            message = f"Query successful, returned {len(data)} rows"
+            if truncated:
+                message += f" (truncated to max_rows={max_rows})"
+            return QueryResult(
+                success=True,
+                columns=columns,
+                data=data,
+                row_count=len(data),
+                message=message,
+                truncated=truncated
+            )
+        except self._error as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+    
+    async def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute sql once per parameter set (%s placeholders), in one transaction.
+        
+        The placeholders match the pymssql adapter's and are rewritten to
+        ODBC ? markers here.
+        """
+        if not self._connected:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            async with self._pool.acquire() as conn:
+                # The pool runs in autocommit mode; keep the batch atomic
+                conn.autocommit = False
+                try:
+                    async with conn.cursor() as cursor:
+                        await cursor.executemany(_qmark(sql), params_batch)
+                        affected = cursor.rowcount
+                    await conn.commit()
+                except self._error:
+                    await conn.rollback()
+                    raise
+                finally:
+                    conn.autocommit = True
+        except self._error as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
+    
+    async def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
+        if not self._connected:
+            return []
+        
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'dbo'
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        _LIST_TABLES_SQL,
+                        schema_filter,
+                        offset,
+                        _NO_LIMIT if limit is None else limit
+                    )
+                    rows = await cursor.fetchall()
+            
+            tables = [
+                TableInfo(
+                    name=row[0],
+                    schema=schema_filter,
+                    table_type=sys.intern(row[1]) if row[1] else "TABLE",
+                    row_count=row[2] if row[2] else None
+                )
+                for row in rows
+            ]
+            
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
+            return tables
+        except self._error:
+            return []
+    
+    async def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'dbo'
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_COUNT_TABLES_SQL, schema_filter)
+                    (count,) = await cursor.fetchone()
+            
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except self._error:
+            return 0
+    
+    async def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
+        """Get table structure."""
+        if not self._connected:
+            return []
+        
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'dbo'
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_DESCRIBE_TABLE_SQL, schema_filter, table_name)
+                    rows = await cursor.fetchall()
+            
+            columns = [
+                ColumnInfo(
+                    name=row[0],
+                    data_type=sys.intern(row[1]),
+                    nullable=bool(row[2]),
+                    is_primary_key=bool(row[3]),
+                    default_value=row[4]
+                )
+                for row in rows
+            ]
+            
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
+            return columns
+        except self._error:
+            return []
+    
+    async def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in a schema."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'dbo'
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_DESCRIBE_SCHEMA_SQL, schema_filter)
+                    rows = await cursor.fetchall()
+            
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except self._error:
+            return {}
+    
+    async def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            schema_filter = schema if schema else 'dbo'
+            query, params = _describe_tables_query(len(missing))
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_bind_params(query, "schema", *params), schema_filter, *missing)
+                    rows = await cursor.fetchall()
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except self._error:
+            return found
@@ -1,16 +1,131 @@
 """MySQL database adapter using PyMySQL."""
 
-from typing import Any
-from decimal import Decimal
-from datetime import datetime, date, timedelta
+import sys
+from typing import Any, Callable, Iterable, Sequence
 
-from .base import DatabaseAdapter, TableInfo, ColumnInfo, QueryResult
+from .base import (
+    DatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+    get_pool,
+)
 
-try:
-    import pymysql
-    PYMYSQL_AVAILABLE = True
-except ImportError:
-    PYMYSQL_AVAILABLE = False
+# Leading keywords of statements that return a result set
+_SELECT_KEYWORDS = frozenset({"SELECT", "SHOW", "DESCRIBE", "EXPLAIN"})
+
+# Metadata queries
+_LIST_TABLES_SQL = """
+    SELECT TABLE_NAME, TABLE_TYPE, TABLE_ROWS
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA = DATABASE()
+    ORDER BY TABLE_NAME
+    LIMIT %s OFFSET %s
+"""
+
+_COUNT_TABLES_SQL = """
+    SELECT COUNT(*)
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA = DATABASE()
+"""
+
+# MySQL has no LIMIT ALL; its manual uses the largest BIGINT UNSIGNED instead
+_NO_LIMIT = 18446744073709551615
+
+_DESCRIBE_TABLE_SQL = """
+    SELECT 
+        COLUMN_NAME,
+        COLUMN_TYPE,
+        IS_NULLABLE,
+        COLUMN_KEY,
+        COLUMN_DEFAULT,
+        EXTRA
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+    AND TABLE_NAME = %s
+    ORDER BY ORDINAL_POSITION
+"""
+
+# Columns of every table in the database, or only of the tables listed
+_DESCRIBE_COLUMNS_SQL = """
+    SELECT 
+        TABLE_NAME,
+        COLUMN_NAME,
+        COLUMN_TYPE,
+        IS_NULLABLE,
+        COLUMN_KEY,
+        COLUMN_DEFAULT,
+        EXTRA
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE(){table_filter}
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+_DESCRIBE_SCHEMA_SQL = _DESCRIBE_COLUMNS_SQL.format(table_filter="")
+
+
+def _describe_tables_sql(count: int) -> str:
+    """The columns query for count tables, named by %s placeholders."""
+    placeholders = ", ".join(["%s"] * count)
+    return _DESCRIBE_COLUMNS_SQL.format(table_filter=f"\n    AND TABLE_NAME IN ({placeholders})")
+
+
+def _bind_executor(conn, stream_cursor: type) -> Callable[[str, bool, int | None], tuple]:
+    """
+    Bind a connection's methods into a statement runner.
+    
+    Built once per connection checkout so execute_query does not look up
+    the connection and its methods through the adapter on every call. The
+    runner returns (description, rows) for statements that produce a result
+    set, fetching at most max_rows + 1 rows, and (None, affected_rows)
+    otherwise.
+    """
+    cursor_factory = conn.cursor
+    commit = conn.commit
+    
+    def execute(sql: str, is_select: bool, max_rows: int | None) -> tuple:
+        if not is_select:
+            cursor = cursor_factory()
+            cursor.execute(sql)
+            commit()
+            affected = cursor.rowcount
+            cursor.close()
+            return None, affected
+        
+        # Stream result sets with an unbuffered cursor instead of
+        # loading the whole set into client memory first
+        cursor = cursor_factory(stream_cursor)
+        cursor.execute(sql)
+        description = cursor.description or ()
+        if max_rows is None:
+            rows = cursor.fetchall()
+        else:
+            # One extra row tells us whether the result was cut short
+            rows = cursor.fetchmany(max_rows + 1)
+        cursor.close()
+        return description, rows
+    
+    return execute
+
+
+def _columns_by_table(rows: Iterable[Sequence[Any]]) -> dict[str, list[ColumnInfo]]:
+    """Group describe-query rows, led by the table name, into columns per table."""
+    columns_by_table: dict[str, list[ColumnInfo]] = {}
+    for row in rows:
+        columns_by_table.setdefault(row[0], []).append(ColumnInfo(
+            name=row[1],
+            data_type=sys.intern(row[2]),
+            nullable=row[3] == 'YES',
+            is_primary_key=row[4] == 'PRI',
+            default_value=row[5],
+            extra=row[6]
+        ))
+    return columns_by_table
 
 
 class MySQLAdapter(DatabaseAdapter):
@@ -18,8 +133,14 @@ class MySQLAdapter(DatabaseAdapter):
     
     def __init__(self):
         super().__init__()
-        if not PYMYSQL_AVAILABLE:
+        self._execute = None
+        # Imported here so only the adapter in use pays for its driver
+        try:
+            import pymysql
+            import pymysql.cursors
+        except ImportError:
             raise ImportError("pymysql is not installed. Run: pip install pymysql")
+        self._driver = pymysql
     
     @property
     def db_type(self) -> str:
@@ -36,52 +157,68 @@ class MySQLAdapter(DatabaseAdapter):
     ) -> dict[str, Any]:
         """Connect to MySQL database."""
         try:
-            self._connection = pymysql.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                database=dbname,
-                connect_timeout=10,
-                charset='utf8mb4'
+            driver = self._driver
+            self._pool = get_pool(
+                self.db_type, host, port, username, password, dbname,
+                factory=lambda: driver.connect(
+                    host=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    database=dbname,
+                    connect_timeout=10,
+                    charset='utf8mb4'
+                ),
+                validate=lambda conn: conn.ping(reconnect=True),
             )
+            self._connection = self._pool.acquire()
+            self._execute = _bind_executor(self._connection, self._driver.cursors.SSCursor)
             self._connected = True
             
-            # Get server info
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT VERSION()")
-            version = cursor.fetchone()[0]
-            cursor.execute("SELECT DATABASE()")
-            current_db = cursor.fetchone()[0]
-            cursor.execute("SELECT USER()")
-            current_user = cursor.fetchone()[0]
-            cursor.close()
+            # Server info only needs to be fetched once per pool
+            if self._pool.server_info is None:
+                cursor = self._connection.cursor()
+                cursor.execute("SELECT VERSION(), DATABASE(), USER()")
+                version, current_db, current_user = cursor.fetchone()
+                cursor.close()
+                self._pool.server_info = {
+                    "server_version": version,
+                    "current_database": current_db,
+                    "current_user": current_user,
+                }
             
             return {
                 "success": True,
-                "server_version": version,
-                "current_database": current_db,
-                "current_user": current_user,
+                **self._pool.server_info,
                 "host": host,
                 "port": port,
             }
-        except pymysql.Error as e:
-            self._connected = False
+        except (self._driver.Error, TimeoutError) as e:
+            self.disconnect()
             raise ConnectionError(f"MySQL connection failed: {e}")
     
     def disconnect(self) -> None:
-        """Disconnect from MySQL database."""
+        """Return the connection to the pool."""
         if self._connection:
             try:
-                self._connection.close()
+                self._pool.release(self._connection)
             except Exception:
                 pass
             self._connection = None
+        self._execute = None
         self._connected = False
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
     
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
-        """Execute a SQL query."""
-        if not self._connected or not self._connection:
+    def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
+        execute = self._execute
+        if execute is None:
             return QueryResult(
                 success=False,
                 error="Not connected to database",
@@ -89,122 +226,224 @@ class MySQLAdapter(DatabaseAdapter):
             )
         
         try:
-            cursor = self._connection.cursor()
-            cursor.execute(sql)
-            
             # Check if it's a SELECT query
-            sql_upper = sql.strip().upper()
-            is_select = (
-                sql_upper.startswith("SELECT") or
-                sql_upper.startswith("SHOW") or
-                sql_upper.startswith("DESCRIBE") or
-                sql_upper.startswith("EXPLAIN")
-            )
+            keyword = first_keyword(sql)
+            is_select = keyword in _SELECT_KEYWORDS
             
-            if is_select:
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                raw_rows = cursor.fetchall()
-                rows = []
-                for row in raw_rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        # Handle special types
-                        if isinstance(value, Decimal):
-                            value = float(value)
-                        elif isinstance(value, (datetime, date)):
-                            value = value.isoformat()
-                        elif isinstance(value, timedelta):
-                            value = str(value)
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='replace')
-                        row_dict[col] = value
-                    rows.append(row_dict)
-                
-                cursor.close()
+            description, fetched = execute(sql, is_select, max_rows)
+            if not is_select:
+                if keyword in DDL_KEYWORDS:
+                    self._metadata_cache.invalidate()
+                    self._description_cache.clear()
                 return QueryResult(
                     success=True,
-                    columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                    message=f"Query successful, returned {len(rows)} rows"
+                    affected_rows=fetched,
+                    message=f"Execution successful, affected {fetched} rows"
                 )
+            
+            truncated = max_rows is not None and len(fetched) > max_rows
+            if truncated:
+                del fetched[max_rows:]
+            
+            # Reuse the column names and converters from an earlier run of
+            # the same statement while its result layout is unchanged
+            cached = self._description_cache.get(sql)
+            if cached is not None and cached[0] == description:
+                _, columns, converters = cached
             else:
-                self._connection.commit()
-                affected = cursor.rowcount
-                cursor.close()
-                return QueryResult(
-                    success=True,
-                    affected_rows=affected,
-                    message=f"Execution successful, affected {affected} rows"
-                )
-        except pymysql.Error as e:
+                columns = tuple(sys.intern(desc[0]) for desc in description)
+                converters = None
+            
+            if converters is None and fetched:
+                converters = build_converters(fetched)
+            data = convert_rows(fetched, converters) if fetched else []
+            
+            if converters is not None:
+                self._description_cache.set(sql, (description, columns, converters))
+            message = f"Query successful, returned {len(data)} rows"
+            if truncated:
+                message += f" (truncated to max_rows={max_rows})"
+            return QueryResult(
+                success=True,
+                columns=columns,
+                data=data,
+                row_count=len(data),
+                message=message,
+                truncated=truncated
+            )
+        except self._driver.Error as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+    
+    def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute sql once per parameter set (%s placeholders), in one transaction.
+        
+        PyMySQL sends an INSERT ... VALUES batch as multi-row INSERTs.
+        """
+        if not self._connected or not self._connection:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.executemany(sql, params_batch)
+            self._connection.commit()
+            affected = cursor.rowcount
+            cursor.close()
+        except self._driver.Error as e:
+            self._connection.rollback()
             return QueryResult(
                 success=False,
                 error=str(e),
                 message="SQL execution failed"
             )
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
     
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
-        """List all tables in the database."""
+    def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
         if not self._connected:
             return []
         
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
         try:
             cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT TABLE_NAME, TABLE_TYPE, TABLE_ROWS
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_SCHEMA = DATABASE()
-                ORDER BY TABLE_NAME
-            """)
+            cursor.execute(_LIST_TABLES_SQL, (_NO_LIMIT if limit is None else limit, offset))
             
-            tables = []
-            for row in cursor.fetchall():
-                tables.append(TableInfo(
+            tables = [
+                TableInfo(
                     name=row[0],
-                    table_type=row[1] if row[1] else "TABLE",
+                    table_type=sys.intern(row[1]) if row[1] else "TABLE",
                     row_count=row[2] if row[2] else None
-                ))
+                )
+                for row in cursor
+            ]
             
             cursor.close()
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
             return tables
-        except pymysql.Error:
+        except self._driver.Error:
             return []
     
+    def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(_COUNT_TABLES_SQL)
+            count = cursor.fetchone()[0]
+            cursor.close()
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except self._driver.Error:
+            return 0
+    
     def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """Get table structure."""
         if not self._connected:
             return []
         
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT 
-                    COLUMN_NAME,
-                    COLUMN_TYPE,
-                    IS_NULLABLE,
-                    COLUMN_KEY,
-                    COLUMN_DEFAULT,
-                    EXTRA
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = DATABASE()
-                AND TABLE_NAME = %s
-                ORDER BY ORDINAL_POSITION
-            """, (table_name,))
+            cursor.execute(_DESCRIBE_TABLE_SQL, (table_name,))
             
-            columns = []
-            for row in cursor.fetchall():
-                columns.append(ColumnInfo(
+            columns = [
+                ColumnInfo(
                     name=row[0],
-                    data_type=row[1],
+                    data_type=sys.intern(row[1]),
                     nullable=row[2] == 'YES',
                     is_primary_key=row[3] == 'PRI',
                     default_value=row[4],
                     extra=row[5]
-                ))
+                )
+                for row in cursor
+            ]
             
             cursor.close()
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
             return columns
-        except pymysql.Error:
+        except self._driver.Error:
             return []
+    
+    def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in the database."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(_DESCRIBE_SCHEMA_SQL)
+            
+            columns_by_table = _columns_by_table(cursor)
+            
+            cursor.close()
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except self._driver.Error:
+            return {}
+    
+    def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(_describe_tables_sql(len(missing)), missing)
+            columns_by_table = _columns_by_table(cursor)
+            cursor.close()
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except self._driver.Error:
+            return found
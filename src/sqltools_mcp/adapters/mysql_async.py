@@ -0,0 +1,354 @@
+"""Asynchronous MySQL database adapter using aiomysql."""
+
+import sys
+from typing import Any, Sequence
+
+from .base import (
+    AsyncDatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+)
+from ..config import POOL_MIN_SIZE, POOL_MAX_SIZE
+from .mysql import (
+    _SELECT_KEYWORDS,
+    _LIST_TABLES_SQL,
+    _COUNT_TABLES_SQL,
+    _DESCRIBE_TABLE_SQL,
+    _DESCRIBE_SCHEMA_SQL,
+    _NO_LIMIT,
+    _columns_by_table,
+    _describe_tables_sql,
+)
+
+
+class AsyncMySQLAdapter(AsyncDatabaseAdapter):
+    """Asynchronous MySQL database adapter."""
+    
+    def __init__(self):
+        super().__init__()
+        try:
+            import aiomysql
+        except ImportError:
+            raise ImportError("aiomysql is not installed. Run: pip install aiomysql")
+        self._driver = aiomysql
+    
+    @property
+    def db_type(self) -> str:
+        return "mysql"
+    
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        dbname: str,
+        **kwargs
+    ) -> dict[str, Any]:
+        """Connect to MySQL database."""
+        try:
+            self._pool = await self._driver.create_pool(
+                host=host,
+                port=port,
+                user=username,
+                password=password,
+                db=dbname,
+                minsize=POOL_MIN_SIZE,
+                maxsize=POOL_MAX_SIZE,
+                connect_timeout=10,
+                charset='utf8mb4',
+                # aiomysql closes connections released inside a transaction,
+                # so statements commit on their own
+                autocommit=True
+            )
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT VERSION(), DATABASE(), USER()")
+                    version, current_db, current_user = await cursor.fetchone()
+            self._connected = True
+            
+            return {
+                "success": True,
+                "server_version": version,
+                "current_database": current_db,
+                "current_user": current_user,
+                "host": host,
+                "port": port,
+            }
+        except self._driver.Error as e:
+            await self.disconnect()
+            raise ConnectionError(f"MySQL connection failed: {e}")
+    
+    async def disconnect(self) -> None:
+        """Close the connection pool."""
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+        self._connected = False
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
+    
+    async def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
+        if not self._connected:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        # Check if it's a SELECT query
+        keyword = first_keyword(sql)
+        is_select = keyword in _SELECT_KEYWORDS
+        
+        try:
+            async with self._pool.acquire() as conn:
+                # Stream result sets with an unbuffered cursor
+                cursor_class = self._driver.SSCursor if is_select else self._driver.Cursor
+                async with conn.cursor(cursor_class) as cursor:
+                    await cursor.execute(sql)
+                    
+                    if not is_select:
+                        affected = cursor.rowcount
+                        if keyword in DDL_KEYWORDS:
+                            self._metadata_cache.invalidate()
+                            self._description_cache.clear()
+                        return QueryResult(
+                            success=True,
+                            affected_rows=affected,
+                            message=f"Execution successful, affected {affected} rows"
+                        )
+                    
+                    description = cursor.description or ()
+                    if max_rows is None:
+                        raw_rows = await cursor.fetchall()
+                    else:
+                        # One extra row tells us whether the result was cut short
+                        raw_rows = await cursor.fetchmany(max_rows + 1)
+            
+            truncated = max_rows is not None and len(raw_rows) > max_rows
+            if truncated:
+                del raw_rows[max_rows:]
+            
+            cached = self._description_cache.get(sql)
+            if cached is not None and cached[0] == description:
+                _, columns, converters = cached
+            else:
+                columns = tuple(sys.intern(desc[0]) for desc in description)
+                converters = None
+            
+            if converters is None and raw_rows:
+                converters = build_converters(raw_rows)
+            data = convert_rows(raw_rows, converters) if raw_rows else []
+            
+            if converters is not None:
+                self._description_cache.set(sql, (description, columns, converters))
+            message = f"Query successful, returned {len(data)} rows"
+            if truncated:
+                message += f" (truncated to max_rows={max_rows})"
+            return QueryResult(
+                success=True,
+                columns=columns,
+                data=data,
+                row_count=len(data),
+                message=message,
+                truncated=truncated
+            )
+        except self._driver.Error as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+    
+    async def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute sql once per parameter set (%s placeholders), in one transaction.
+        
+        aiomysql sends an INSERT ... VALUES batch as multi-row INSERTs.
+        """
+        if not self._connected:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            async with self._pool.acquire() as conn:
+                # The pool runs in autocommit mode; keep the batch atomic
+                await conn.begin()
+                try:
+                    async with conn.cursor() as cursor:
+                        await cursor.executemany(sql, params_batch)
+                        affected = cursor.rowcount
+                    await conn.commit()
+                except self._driver.Error:
+                    await conn.rollback()
+                    raise
+        except self._driver.Error as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
+    
+    async def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
+        if not self._connected:
+            return []
+        
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_LIST_TABLES_SQL, (_NO_LIMIT if limit is None else limit, offset))
+                    rows = await cursor.fetchall()
+            
+            tables = [
+                TableInfo(
+                    name=row[0],
+                    table_type=sys.intern(row[1]) if row[1] else "TABLE",
+                    row_count=row[2] if row[2] else None
+                )
+                for row in rows
+            ]
+            
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
+            return tables
+        except self._driver.Error:
+            return []
+    
+    async def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_COUNT_TABLES_SQL)
+                    (count,) = await cursor.fetchone()
+            
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except self._driver.Error:
+            return 0
+    
+    async def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
+        """Get table structure."""
+        if not self._connected:
+            return []
+        
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_DESCRIBE_TABLE_SQL, (table_name,))
+                    rows = await cursor.fetchall()
+            
+            columns = [
+                ColumnInfo(
+                    name=row[0],
+                    data_type=sys.intern(row[1]),
+                    nullable=row[2] == 'YES',
+                    is_primary_key=row[3] == 'PRI',
+                    default_value=row[4],
+                    extra=row[5]
+                )
+                for row in rows
+            ]
+            
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
+            return columns
+        except self._driver.Error:
+            return []
+    
+    async def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in the database."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_DESCRIBE_SCHEMA_SQL)
+                    rows = await cursor.fetchall()
+            
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except self._driver.Error:
+            return {}
+    
+    async def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_describe_tables_sql(len(missing)), missing)
+                    rows = await cursor.fetchall()
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except self._driver.Error:
+            return found
@@ -1,17 +1,182 @@
 """PostgreSQL database adapter using psycopg2."""
 
-from typing import Any
-from decimal import Decimal
-from datetime import datetime, date, timedelta
+import functools
+import hashlib
+import sys
+from typing import Any, Iterable, Sequence
 
-from .base import DatabaseAdapter, TableInfo, ColumnInfo, QueryResult
+from .base import (
+    DatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+    get_pool,
+)
 
-try:
+
+def _cast_float(value: str | None, cursor: Any) -> float | None:
+    return float(value) if value is not None else None
+
+
+def _cast_iso_datetime(value: str | None, cursor: Any) -> str | None:
+    # psycopg2 sets DateStyle to ISO, so only the date/time separator differs
+    return value.replace(" ", "T", 1) if value is not None else None
+
+
+@functools.lru_cache(maxsize=1)
+def _type_casters() -> tuple[Any, ...]:
+    """
+    Typecasters that turn result text straight into its JSON-ready form.
+    
+    They replace psycopg2's Decimal, datetime and memoryview objects, which
+    would otherwise be built only to be converted again row by row. Built on
+    first use, as psycopg2 is only imported once a connection is opened.
+    """
     import psycopg2
-    import psycopg2.extras
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    PSYCOPG2_AVAILABLE = False
+    
+    extensions = psycopg2.extensions
+    binary = psycopg2.BINARY
+    
+    def cast_bytea_text(value: str | None, cursor: Any) -> str | None:
+        if value is None:
+            return None
+        return bytes(binary(value, cursor)).decode('utf-8', errors='replace')
+    
+    return (
+        extensions.new_type(extensions.DECIMAL.values, "SQLTOOLS_FLOAT", _cast_float),
+        extensions.new_type(
+            extensions.PYDATETIME.values + extensions.PYDATETIMETZ.values + extensions.PYDATE.values,
+            "SQLTOOLS_ISO_DATETIME",
+            _cast_iso_datetime
+        ),
+        extensions.new_type(binary.values, "SQLTOOLS_BYTEA_TEXT", cast_bytea_text),
+    )
+
+
+def _open_connection(driver: Any, **params: Any) -> Any:
+    """Open a connection for the pool, with the result typecasters registered."""
+    conn = driver.connect(**params)
+    for caster in _type_casters():
+        driver.extensions.register_type(caster, conn)
+    return conn
+
+
+def _check_alive(conn) -> None:
+    """Health check for pooled connections, raises if the connection is dead."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1")
+    finally:
+        cursor.close()
+    conn.rollback()
+
+
+# Leading keywords of statements that return a result set
+_SELECT_KEYWORDS = frozenset({"SELECT", "WITH", "SHOW", "EXPLAIN"})
+
+# Leading keywords of statements that can be read through a server-side cursor
+_CURSOR_KEYWORDS = frozenset({"SELECT", "WITH"})
+
+# Name of the server-side cursor SELECT results are read through
+NAMED_CURSOR_NAME = "sqltools_result"
+
+# Rows fetched per round trip from the server-side cursor
+FETCH_BATCH_SIZE = 1000
+
+# Prepared statement a parameter batch is run through, and the number of
+# EXECUTEs sent per round trip
+BATCH_STATEMENT_NAME = "sqltools_batch"
+EXECUTE_BATCH_PAGE_SIZE = 500
+
+# Metadata queries, written with $n placeholders so they can be prepared
+_LIST_TABLES_SQL = """
+    SELECT
+        t.table_name,
+        t.table_type,
+        s.reltuples::bigint as row_count
+    FROM information_schema.tables t
+    LEFT JOIN LATERAL (
+        SELECT c.reltuples
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relname = t.table_name AND n.nspname = t.table_schema
+    ) s ON true
+    WHERE t.table_schema = $1
+    ORDER BY t.table_name
+    LIMIT $2 OFFSET $3
+"""
+
+_COUNT_TABLES_SQL = """
+    SELECT count(*)
+    FROM information_schema.tables
+    WHERE table_schema = $1
+"""
+
+_DESCRIBE_TABLE_SQL = """
+    SELECT
+        c.column_name,
+        c.data_type,
+        c.is_nullable,
+        CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as is_primary_key,
+        c.column_default
+    FROM information_schema.columns c
+    LEFT JOIN (
+        SELECT ku.column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage ku
+            ON tc.constraint_name = ku.constraint_name
+        WHERE tc.constraint_type = 'PRIMARY KEY'
+        AND tc.table_schema = $1
+        AND tc.table_name = $2
+    ) pk ON c.column_name = pk.column_name
+    WHERE c.table_schema = $1 AND c.table_name = $2
+    ORDER BY c.ordinal_position
+"""
+
+# Columns of every table in a schema, or only of the tables in an array
+_DESCRIBE_COLUMNS_SQL = """
+    SELECT
+        c.table_name,
+        c.column_name,
+        c.data_type,
+        c.is_nullable,
+        CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as is_primary_key,
+        c.column_default
+    FROM information_schema.columns c
+    LEFT JOIN (
+        SELECT ku.table_name, ku.column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage ku
+            ON tc.constraint_name = ku.constraint_name
+            AND tc.table_schema = ku.table_schema
+        WHERE tc.constraint_type = 'PRIMARY KEY'
+        AND tc.table_schema = $1
+    ) pk ON c.table_name = pk.table_name AND c.column_name = pk.column_name
+    WHERE c.table_schema = $1{table_filter}
+    ORDER BY c.table_name, c.ordinal_position
+"""
+
+_DESCRIBE_SCHEMA_SQL = _DESCRIBE_COLUMNS_SQL.format(table_filter="")
+_DESCRIBE_TABLES_SQL = _DESCRIBE_COLUMNS_SQL.format(table_filter="\n    AND c.table_name = ANY($2)")
+
+
+def _columns_by_table(rows: Iterable[Sequence[Any]]) -> dict[str, list[ColumnInfo]]:
+    """Group describe-query rows, led by the table name, into columns per table."""
+    columns_by_table: dict[str, list[ColumnInfo]] = {}
+    for row in rows:
+        columns_by_table.setdefault(row[0], []).append(ColumnInfo(
+            name=row[1],
+            data_type=sys.intern(row[2]),
+            nullable=row[3] == 'YES',
+            is_primary_key=row[4],
+            default_value=row[5]
+        ))
+    return columns_by_table
 
 
 class PostgresAdapter(DatabaseAdapter):
@@ -19,8 +184,15 @@ class PostgresAdapter(DatabaseAdapter):
     
     def __init__(self):
         super().__init__()
-        if not PSYCOPG2_AVAILABLE:
+        try:
+            import psycopg2
+            import psycopg2.errors
+            import psycopg2.extensions
+        except ImportError:
             raise ImportError("psycopg2 is not installed. Run: pip install psycopg2-binary")
+        self._driver = psycopg2
+        # Server-side prepared statement names, keyed by SQL text
+        self._statements: dict[str, str] = {}
     
     @property
     def db_type(self) -> str:
@@ -37,50 +209,99 @@ class PostgresAdapter(DatabaseAdapter):
     ) -> dict[str, Any]:
         """Connect to PostgreSQL database."""
         try:
-            self._connection = psycopg2.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                dbname=dbname,
-                connect_timeout=10
+            self._pool = get_pool(
+                self.db_type, host, port, username, password, dbname,
+                factory=lambda: _open_connection(
+                    self._driver,
+                    host=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    dbname=dbname,
+                    connect_timeout=10
+                ),
+                validate=_check_alive,
             )
+            self._connection = self._pool.acquire()
             self._connected = True
             
-            # Get server info
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT version()")
-            version = cursor.fetchone()[0]
-            cursor.execute("SELECT current_database()")
-            current_db = cursor.fetchone()[0]
-            cursor.execute("SELECT current_user")
-            current_user = cursor.fetchone()[0]
-            cursor.close()
+            # Server info only needs to be fetched once per pool
+            if self._pool.server_info is None:
+                cursor = self._connection.cursor()
+                cursor.execute("SELECT version(), current_database(), current_user")
+                version, current_db, current_user = cursor.fetchone()
+                cursor.close()
+                self._connection.rollback()
+                self._pool.server_info = {
+                    "server_version": version,
+                    "current_database": current_db,
+                    "current_user": current_user,
+                }
             
             return {
                 "success": True,
-                "server_version": version,
-                "current_database": current_db,
-                "current_user": current_user,
+                **self._pool.server_info,
                 "host": host,
                 "port": port,
             }
-        except psycopg2.Error as e:
-            self._connected = False
+        except (self._driver.Error, TimeoutError) as e:
+            self.disconnect()
             raise ConnectionError(f"PostgreSQL connection failed: {e}")
     
     def disconnect(self) -> None:
-        """Disconnect from PostgreSQL database."""
+        """Return the connection to the pool."""
         if self._connection:
             try:
-                self._connection.close()
+                self._pool.release(self._connection)
             except Exception:
                 pass
             self._connection = None
+        self._statements.clear()
         self._connected = False
+        self._metadata_cache.invalidate()
     
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
-        """Execute a SQL query."""
+    def _query_prepared(self, sql: str, *params: Any) -> list[tuple]:
+        """
+        Run a metadata query through a server-side prepared statement.
+        
+        Statements are prepared once per connection, so PostgreSQL parses
+        and plans them only on first use. Names are derived from the SQL
+        text, so a statement left on a reused connection by an earlier
+        session is simply picked up again.
+        """
+        cursor = self._connection.cursor()
+        try:
+            name = self._statements.get(sql)
+            if name is None:
+                name = "sqltools_" + hashlib.blake2b(sql.encode(), digest_size=8).hexdigest()
+                try:
+                    cursor.execute(f"PREPARE {name} AS {sql}")
+                except self._driver.errors.DuplicatePreparedStatement:
+                    self._connection.rollback()
+                self._statements[sql] = name
+            
+            placeholders = ", ".join(["%s"] * len(params))
+            try:
+                cursor.execute(f"EXECUTE {name}({placeholders})", params)
+            except self._driver.errors.InvalidSqlStatementName:
+                # Dropped by a DEALLOCATE or DISCARD sent through execute_sql
+                self._connection.rollback()
+                cursor.execute(f"PREPARE {name} AS {sql}")
+                cursor.execute(f"EXECUTE {name}({placeholders})", params)
+            return cursor.fetchall()
+        except self._driver.Error:
+            self._connection.rollback()
+            raise
+        finally:
+            cursor.close()
+    
+    def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
         if not self._connected or not self._connection:
             return QueryResult(
                 success=False,
@@ -89,56 +310,78 @@ class PostgresAdapter(DatabaseAdapter):
             )
         
         try:
-            cursor = self._connection.cursor()
-            cursor.execute(sql)
-            
             # Check if it's a SELECT query
-            sql_upper = sql.strip().upper()
-            is_select = (
-                sql_upper.startswith("SELECT") or
-                sql_upper.startswith("WITH") or
-                sql_upper.startswith("SHOW") or
-                sql_upper.startswith("EXPLAIN")
-            )
+            keyword = first_keyword(sql)
+            is_select = keyword in _SELECT_KEYWORDS
+            
+            cursor = None
+            if keyword in _CURSOR_KEYWORDS and ";" not in sql.rstrip(" \t\r\n;"):
+                # Read single queries through a server-side cursor, so the
+                # result stays on the server until it is fetched in batches
+                cursor = self._connection.cursor(name=NAMED_CURSOR_NAME)
+                try:
+                    cursor.execute(sql)
+                except (self._driver.errors.FeatureNotSupported, self._driver.errors.SyntaxError):
+                    # DECLARE rejects SELECT ... INTO and data-modifying
+                    # WITH clauses; a plain cursor runs (or reports) those
+                    self._connection.rollback()
+                    cursor = None
+            if cursor is None:
+                cursor = self._connection.cursor()
+                cursor.execute(sql)
             
-            if is_select and cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                raw_rows = cursor.fetchall()
-                rows = []
-                for row in raw_rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        # Handle special types
-                        if isinstance(value, Decimal):
-                            value = float(value)
-                        elif isinstance(value, (datetime, date)):
-                            value = value.isoformat()
-                        elif isinstance(value, timedelta):
-                            value = str(value)
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='replace')
-                        row_dict[col] = value
-                    rows.append(row_dict)
+            # Server-side cursors only describe their columns once fetched from
+            if is_select and (cursor.name is not None or cursor.description):
+                raw_rows = []
+                # One extra row tells us whether the result was cut short
+                while max_rows is None or len(raw_rows) <= max_rows:
+                    if max_rows is None:
+                        batch_size = FETCH_BATCH_SIZE
+                    else:
+                        batch_size = min(FETCH_BATCH_SIZE, max_rows + 1 - len(raw_rows))
+                    batch = cursor.fetchmany(batch_size)
+                    raw_rows.extend(batch)
+                    if len(batch) < batch_size:
+                        break
+                columns = [sys.intern(desc[0]) for desc in cursor.description]
+                truncated = max_rows is not None and len(raw_rows) > max_rows
+                if truncated:
+                    del raw_rows[max_rows:]
+                
+                if len(columns) == 1 and len(raw_rows) == 1 and type(raw_rows[0][0]) in (int, float):
+                    # COUNT(*)-style scalar results need no conversion
+                    data = [[raw_rows[0][0]]]
+                elif raw_rows:
+                    # Pick each column's converter once, from the first rows
+                    converters = build_converters(raw_rows)
+                    data = convert_rows(raw_rows, converters)
+                else:
+                    data = []
                 
                 cursor.close()
+                message = f"Query successful, returned {len(data)} rows"
+                if truncated:
+                    message += f" (truncated to max_rows={max_rows})"
                 return QueryResult(
                     success=True,
                     columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                    message=f"Query successful, returned {len(rows)} rows"
+                    data=data,
+                    row_count=len(data),
+                    message=message,
+                    truncated=truncated
                 )
             else:
                 self._connection.commit()
                 affected = cursor.rowcount
                 cursor.close()
+                if keyword in DDL_KEYWORDS:
+                    self._metadata_cache.invalidate()
                 return QueryResult(
                     success=True,
                     affected_rows=affected,
                     message=f"Execution successful, affected {affected} rows"
                 )
-        except psycopg2.Error as e:
+        except self._driver.Error as e:
             self._connection.rollback()
             return QueryResult(
                 success=False,
@@ -146,78 +389,189 @@ class PostgresAdapter(DatabaseAdapter):
                 message="SQL execution failed"
             )
     
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
-        """List all tables in the database."""
+    def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute sql once per parameter set ($1, $2, ... placeholders), in one transaction.
+        
+        The statement is prepared once and its EXECUTEs are sent
+        EXECUTE_BATCH_PAGE_SIZE at a time. PostgreSQL only reports the row
+        count of the last statement in such a page, so affected_rows is -1.
+        """
+        if not self._connected or not self._connection:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        # Imported here as psycopg2.extras is slow to import and rarely needed
+        from psycopg2.extras import execute_batch
+        
+        cursor = self._connection.cursor()
+        prepared = False
+        try:
+            cursor.execute(f"PREPARE {BATCH_STATEMENT_NAME} AS {sql}")
+            prepared = True
+            placeholders = ", ".join(["%s"] * len(params_batch[0]))
+            execute_batch(
+                cursor,
+                f"EXECUTE {BATCH_STATEMENT_NAME}({placeholders})",
+                params_batch,
+                page_size=EXECUTE_BATCH_PAGE_SIZE
+            )
+            self._connection.commit()
+            affected = -1
+        except self._driver.Error as e:
+            self._connection.rollback()
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+        finally:
+            # Prepared statements outlive transactions, so drop it explicitly
+            if prepared:
+                try:
+                    cursor.execute(f"DEALLOCATE {BATCH_STATEMENT_NAME}")
+                    self._connection.commit()
+                except self._driver.Error:
+                    self._connection.rollback()
+            cursor.close()
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
+    
+    def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
         if not self._connected:
             return []
         
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
         try:
-            cursor = self._connection.cursor()
             schema_filter = schema if schema else 'public'
-            cursor.execute("""
-                SELECT 
-                    table_name,
-                    table_type,
-                    (SELECT reltuples::bigint FROM pg_class WHERE relname = table_name) as row_count
-                FROM information_schema.tables
-                WHERE table_schema = %s
-                ORDER BY table_name
-            """, (schema_filter,))
+            # A NULL limit returns every remaining row
+            rows = self._query_prepared(_LIST_TABLES_SQL, schema_filter, limit, offset)
             
-            tables = []
-            for row in cursor.fetchall():
-                tables.append(TableInfo(
+            tables = [
+                TableInfo(
                     name=row[0],
                     schema=schema_filter,
-                    table_type=row[1] if row[1] else "TABLE",
+                    table_type=sys.intern(row[1]) if row[1] else "TABLE",
                     row_count=row[2] if row[2] else None
-                ))
+                )
+                for row in rows
+            ]
             
-            cursor.close()
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
             return tables
-        except psycopg2.Error:
+        except self._driver.Error:
             return []
     
+    def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            count = self._query_prepared(_COUNT_TABLES_SQL, schema_filter)[0][0]
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except self._driver.Error:
+            return 0
+    
     def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """Get table structure."""
         if not self._connected:
             return []
         
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            cursor = self._connection.cursor()
             schema_filter = schema if schema else 'public'
-            cursor.execute("""
-                SELECT 
-                    c.column_name,
-                    c.data_type,
-                    c.is_nullable,
-                    CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as is_primary_key,
-                    c.column_default
-                FROM information_schema.columns c
-                LEFT JOIN (
-                    SELECT ku.column_name
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage ku
-                        ON tc.constraint_name = ku.constraint_name
-                    WHERE tc.constraint_type = 'PRIMARY KEY'
-                    AND tc.table_schema = %s
-                    AND tc.table_name = %s
-                ) pk ON c.column_name = pk.column_name
-                WHERE c.table_schema = %s AND c.table_name = %s
-                ORDER BY c.ordinal_position
-            """, (schema_filter, table_name, schema_filter, table_name))
+            rows = self._query_prepared(_DESCRIBE_TABLE_SQL, schema_filter, table_name)
             
-            columns = []
-            for row in cursor.fetchall():
-                columns.append(ColumnInfo(
+            columns = [
+                ColumnInfo(
                     name=row[0],
-                    data_type=row[1],
+                    data_type=sys.intern(row[1]),
                     nullable=row[2] == 'YES',
                     is_primary_key=row[3],
                     default_value=row[4]
-                ))
+                )
+                for row in rows
+            ]
             
-            cursor.close()
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
             return columns
-        except psycopg2.Error:
+        except self._driver.Error:
             return []
+    
+    def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in a schema."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            rows = self._query_prepared(_DESCRIBE_SCHEMA_SQL, schema_filter)
+            
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except self._driver.Error:
+            return {}
+    
+    def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            rows = self._query_prepared(_DESCRIBE_TABLES_SQL, schema_filter, missing)
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except self._driver.Error:
+            return found
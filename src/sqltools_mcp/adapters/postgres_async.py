@@ -0,0 +1,371 @@
+"""Asynchronous PostgreSQL database adapter using asyncpg."""
+
+import asyncio
+import json
+import sys
+from typing import Any, Sequence
+
+from .base import (
+    AsyncDatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    build_converters,
+    convert_rows,
+    first_keyword,
+)
+from ..config import POOL_MIN_SIZE, POOL_MAX_SIZE
+from .postgres import (
+    _SELECT_KEYWORDS,
+    _LIST_TABLES_SQL,
+    _COUNT_TABLES_SQL,
+    _DESCRIBE_TABLE_SQL,
+    _DESCRIBE_SCHEMA_SQL,
+    _DESCRIBE_TABLES_SQL,
+    _columns_by_table,
+)
+
+# Prepared statements kept per pooled connection
+STATEMENT_CACHE_SIZE = 1024
+
+
+def _affected_rows(status: str) -> int:
+    """Row count from a command status such as 'INSERT 0 5' (-1 if none)."""
+    count = status.rpartition(" ")[2]
+    return int(count) if count.isdigit() else -1
+
+
+class AsyncPostgresAdapter(AsyncDatabaseAdapter):
+    """Asynchronous PostgreSQL database adapter."""
+    
+    def __init__(self):
+        super().__init__()
+        try:
+            import asyncpg
+        except ImportError:
+            raise ImportError("asyncpg is not installed. Run: pip install asyncpg")
+        self._driver = asyncpg
+        self._errors = (asyncpg.PostgresError, asyncpg.InterfaceError, asyncio.TimeoutError)
+    
+    @property
+    def db_type(self) -> str:
+        return "postgres"
+    
+    @staticmethod
+    async def _init_connection(conn: Any) -> None:
+        """Set up a newly opened pool connection."""
+        # Decode numerics as floats and JSON as parsed values, as psycopg2
+        # does; intervals arrive as timedeltas and are formatted the same way
+        # as the psycopg2 adapter's by the shared converters
+        await conn.set_type_codec(
+            'numeric', schema='pg_catalog', encoder=str, decoder=float, format='text'
+        )
+        for json_type in ('json', 'jsonb'):
+            await conn.set_type_codec(
+                json_type, schema='pg_catalog', encoder=json.dumps, decoder=json.loads, format='text'
+            )
+    
+    async def connect(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        dbname: str,
+        **kwargs
+    ) -> dict[str, Any]:
+        """Connect to PostgreSQL database."""
+        try:
+            self._pool = await self._driver.create_pool(
+                host=host,
+                port=port,
+                user=username,
+                password=password,
+                database=dbname,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                statement_cache_size=STATEMENT_CACHE_SIZE,
+                init=self._init_connection,
+                timeout=10
+            )
+            version, current_db, current_user = await self._pool.fetchrow(
+                "SELECT version(), current_database(), current_user"
+            )
+            self._connected = True
+            
+            return {
+                "success": True,
+                "server_version": version,
+                "current_database": current_db,
+                "current_user": current_user,
+                "host": host,
+                "port": port,
+            }
+        except (*self._errors, OSError) as e:
+            await self.disconnect()
+            raise ConnectionError(f"PostgreSQL connection failed: {e}")
+    
+    async def disconnect(self) -> None:
+        """Close the connection pool."""
+        if self._pool is not None:
+            try:
+                await self._pool.close()
+            except Exception:
+                pass
+            self._pool = None
+        self._connected = False
+        self._metadata_cache.invalidate()
+        self._description_cache.clear()
+    
+    async def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
+        if not self._connected:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        # Check if it's a SELECT query
+        keyword = first_keyword(sql)
+        is_select = keyword in _SELECT_KEYWORDS
+        
+        try:
+            async with self._pool.acquire() as conn:
+                statement = None
+                if is_select:
+                    try:
+                        statement = await conn.prepare(sql, timeout=timeout)
+                    except self._driver.PostgresSyntaxError as e:
+                        if "multiple commands" not in str(e):
+                            raise
+                        # A prepared statement holds a single command; the
+                        # script runs below, though its rows cannot be read
+                
+                if statement is None:
+                    # Simple query protocol, so several statements may be sent
+                    status = await conn.execute(sql, timeout=timeout)
+                    affected = _affected_rows(status)
+                    if keyword in DDL_KEYWORDS:
+                        self._metadata_cache.invalidate()
+                        self._description_cache.clear()
+                    return QueryResult(
+                        success=True,
+                        affected_rows=affected,
+                        message=f"Execution successful, affected {affected} rows"
+                    )
+                
+                description = statement.get_attributes()
+                if max_rows is None:
+                    records = await statement.fetch(timeout=timeout)
+                else:
+                    # Read through a portal so only max_rows + 1 rows are
+                    # transferred; portals need an open transaction
+                    async with conn.transaction():
+                        cursor = await statement.cursor(timeout=timeout)
+                        records = await cursor.fetch(max_rows + 1, timeout=timeout)
+            
+            truncated = max_rows is not None and len(records) > max_rows
+            if truncated:
+                del records[max_rows:]
+            
+            cached = self._description_cache.get(sql)
+            if cached is not None and cached[0] == description:
+                _, columns, converters = cached
+            else:
+                columns = tuple(sys.intern(attribute.name) for attribute in description)
+                converters = None
+            
+            if converters is None and records:
+                converters = build_converters(records)
+            data = convert_rows(records, converters) if records else []
+            
+            if converters is not None:
+                self._description_cache.set(sql, (description, columns, converters))
+            message = f"Query successful, returned {len(data)} rows"
+            if truncated:
+                message += f" (truncated to max_rows={max_rows})"
+            return QueryResult(
+                success=True,
+                columns=columns,
+                data=data,
+                row_count=len(data),
+                message=message,
+                truncated=truncated
+            )
+        except self._errors as e:
+            return QueryResult(
+                success=False,
+                error=str(e) or type(e).__name__,
+                message="SQL execution failed"
+            )
+    
+    async def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute sql once per parameter set ($1, $2, ... placeholders), atomically.
+        
+        asyncpg pipelines the executions, so the whole batch costs about one
+        round trip. It does not report row counts, so affected_rows is -1.
+        """
+        if not self._connected:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.executemany(sql, params_batch, timeout=timeout)
+            affected = -1
+        except self._errors as e:
+            return QueryResult(
+                success=False,
+                error=str(e) or type(e).__name__,
+                message="SQL execution failed"
+            )
+        
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
+    
+    async def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
+        if not self._connected:
+            return []
+        
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            # A NULL limit returns every remaining row
+            rows = await self._pool.fetch(_LIST_TABLES_SQL, schema_filter, limit, offset)
+            
+            tables = [
+                TableInfo(
+                    name=row[0],
+                    schema=schema_filter,
+                    table_type=sys.intern(row[1]) if row[1] else "TABLE",
+                    row_count=row[2] if row[2] else None
+                )
+                for row in rows
+            ]
+            
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
+            return tables
+        except self._errors:
+            return []
+    
+    async def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            count = await self._pool.fetchval(_COUNT_TABLES_SQL, schema_filter)
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except self._errors:
+            return 0
+    
+    async def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
+        """Get table structure."""
+        if not self._connected:
+            return []
+        
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            rows = await self._pool.fetch(_DESCRIBE_TABLE_SQL, schema_filter, table_name)
+            
+            columns = [
+                ColumnInfo(
+                    name=row[0],
+                    data_type=sys.intern(row[1]),
+                    nullable=row[2] == 'YES',
+                    is_primary_key=row[3],
+                    default_value=row[4]
+                )
+                for row in rows
+            ]
+            
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
+            return columns
+        except self._errors:
+            return []
+    
+    async def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table in a schema."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            rows = await self._pool.fetch(_DESCRIBE_SCHEMA_SQL, schema_filter)
+            
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except self._errors:
+            return {}
+    
+    async def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            schema_filter = schema if schema else 'public'
+            rows = await self._pool.fetch(_DESCRIBE_TABLES_SQL, schema_filter, missing)
+            columns_by_table = _columns_by_table(rows)
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except self._errors:
+            return found
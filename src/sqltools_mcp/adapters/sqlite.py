@@ -2,11 +2,106 @@
 
 import os
 import sqlite3
-from typing import Any
-from decimal import Decimal
-from datetime import datetime, date, timedelta
+import sys
+from typing import Any, Iterable, Sequence
 
-from .base import DatabaseAdapter, TableInfo, ColumnInfo, QueryResult
+from .base import (
+    DatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    DDL_KEYWORDS,
+    DEFAULT_MAX_ROWS,
+    first_keyword,
+)
+
+# Leading keywords of statements that return a result set
+_SELECT_KEYWORDS = frozenset({"SELECT", "WITH", "PRAGMA", "EXPLAIN"})
+
+# Metadata queries; a negative LIMIT returns every remaining row
+_LIST_TABLES_SQL = """
+    SELECT name, type
+    FROM sqlite_master
+    WHERE type IN ('table', 'view')
+    AND name NOT LIKE 'sqlite_%'
+    ORDER BY name
+    LIMIT ? OFFSET ?
+"""
+
+_COUNT_TABLES_SQL = """
+    SELECT COUNT(*)
+    FROM sqlite_master
+    WHERE type IN ('table', 'view')
+    AND name NOT LIKE 'sqlite_%'
+"""
+
+# Columns of every table and view, via the table-valued pragma function
+_DESCRIBE_SCHEMA_SQL = """
+    SELECT m.name, p.name, p.type, p."notnull", p.pk, p.dflt_value
+    FROM sqlite_master m
+    JOIN pragma_table_info(m.name) p
+    WHERE m.type IN ('table', 'view')
+    AND m.name NOT LIKE 'sqlite_%'
+    ORDER BY m.name, p.cid
+"""
+
+# Columns of the tables named in a VALUES list, reported under those names
+# (pragma_table_info matches them case-insensitively, as describe_table does)
+_DESCRIBE_TABLES_SQL = """
+    WITH requested(name) AS (VALUES {values})
+    SELECT r.name, p.name, p.type, p."notnull", p.pk, p.dflt_value
+    FROM requested r
+    JOIN pragma_table_info(r.name) p
+    ORDER BY r.name, p.cid
+"""
+
+# SQLite's default limit on the terms of one compound SELECT
+MAX_COMPOUND_SELECT = 500
+
+# Per-connection tuning for read-heavy use: memory-map up to 256 MiB of the
+# file, cache up to 64 MiB of pages and keep temporary tables in memory
+_CONNECTION_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Compiled statements kept per connection, keyed by SQL text, so a repeated
+# query skips parsing and planning
+STATEMENT_CACHE_SIZE = 1024
+
+# Switch writable database files to write-ahead logging (SQLITE_WAL=0 keeps
+# their journal mode as it is)
+USE_WAL = os.getenv("SQLITE_WAL", "1") != "0"
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a table name for use in SQL text."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _is_writable(db_path: str) -> bool:
+    """Whether both the file and its directory (for the -wal file) are writable."""
+    return os.access(db_path, os.W_OK) and os.access(os.path.dirname(db_path), os.W_OK)
+
+
+def _describe_tables_sql(count: int) -> str:
+    """The columns query for count tables, named by ? placeholders."""
+    return _DESCRIBE_TABLES_SQL.format(values=", ".join(["(?)"] * count))
+
+
+def _columns_by_table(rows: Iterable[Sequence[Any]]) -> dict[str, list[ColumnInfo]]:
+    """Group describe-query rows, led by the table name, into columns per table."""
+    columns_by_table: dict[str, list[ColumnInfo]] = {}
+    for row in rows:
+        columns_by_table.setdefault(row[0], []).append(ColumnInfo(
+            name=row[1],
+            data_type=sys.intern(row[2]),
+            nullable=not row[3],
+            is_primary_key=bool(row[4]),
+            default_value=row[5]
+        ))
+    return columns_by_table
 
 
 class SQLiteAdapter(DatabaseAdapter):
@@ -39,13 +134,34 @@ class SQLiteAdapter(DatabaseAdapter):
             # dbname is the file path for SQLite
             db_path = dbname
             
-            # Check if file exists (unless it's :memory:)
-            if db_path != ":memory:" and not os.path.exists(db_path):
-                raise FileNotFoundError(f"Database file not found: {db_path}")
+            # One stat both checks the file exists and gives its size
+            file_size = None
+            if db_path != ":memory:":
+                try:
+                    file_size = os.stat(db_path).st_size
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Database file not found: {db_path}")
             
             self._db_path = os.path.abspath(db_path) if db_path != ":memory:" else db_path
-            self._connection = sqlite3.connect(self._db_path)
-            self._connection.row_factory = sqlite3.Row
+            # The connection manager runs calls on worker threads, one at a time
+            self._connection = sqlite3.connect(
+                self._db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                self._connection.execute(pragma)
+            if USE_WAL and self._db_path != ":memory:" and _is_writable(self._db_path):
+                # Readers and the writer stop blocking each other, and commits
+                # no longer sync the main file. The mode is stored in the file
+                try:
+                    self._connection.execute("PRAGMA journal_mode=WAL")
+                    self._connection.execute("PRAGMA synchronous=NORMAL")
+                except sqlite3.OperationalError:
+                    # Another connection holds a lock; keep the current mode
+                    pass
+            # Rows stay plain tuples: they are built in C, and results are
+            # only ever read by position
             self._connected = True
             
             # Get SQLite version and file info
@@ -53,10 +169,6 @@ class SQLiteAdapter(DatabaseAdapter):
             cursor.execute("SELECT sqlite_version()")
             version = cursor.fetchone()[0]
             
-            file_size = None
-            if self._db_path != ":memory:":
-                file_size = os.path.getsize(self._db_path)
-            
             cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
             table_count = cursor.fetchone()[0]
             cursor.close()
@@ -82,9 +194,15 @@ class SQLiteAdapter(DatabaseAdapter):
             self._connection = None
         self._connected = False
         self._db_path = None
+        self._metadata_cache.invalidate()
     
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
-        """Execute a SQL query."""
+    def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a SQL query, returning at most max_rows rows."""
         if not self._connected or not self._connection:
             return QueryResult(
                 success=False,
@@ -97,45 +215,56 @@ class SQLiteAdapter(DatabaseAdapter):
             cursor.execute(sql)
             
             # Check if it's a SELECT query
-            sql_upper = sql.strip().upper()
-            is_select = (
-                sql_upper.startswith("SELECT") or
-                sql_upper.startswith("PRAGMA") or
-                sql_upper.startswith("EXPLAIN")
-            )
+            keyword = first_keyword(sql)
+            is_select = keyword in _SELECT_KEYWORDS
             
             if is_select and cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                raw_rows = cursor.fetchall()
-                rows = []
-                for row in raw_rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        # Handle special types
-                        if isinstance(value, Decimal):
-                            value = float(value)
-                        elif isinstance(value, (datetime, date)):
-                            value = value.isoformat()
-                        elif isinstance(value, timedelta):
-                            value = str(value)
-                        elif isinstance(value, bytes):
-                            value = value.decode('utf-8', errors='replace')
-                        row_dict[col] = value
-                    rows.append(row_dict)
+                columns = [sys.intern(desc[0]) for desc in cursor.description]
+                if max_rows is None:
+                    raw_rows = cursor.fetchall()
+                else:
+                    # One extra row tells us whether the result was cut short
+                    raw_rows = cursor.fetchmany(max_rows + 1)
+                truncated = max_rows is not None and len(raw_rows) > max_rows
+                if truncated:
+                    del raw_rows[max_rows:]
+                
+                if len(columns) == 1 and len(raw_rows) == 1 and type(raw_rows[0][0]) in (int, float):
+                    # COUNT(*)-style scalar results need no conversion
+                    data = [[raw_rows[0][0]]]
+                else:
+                    # SQLite columns are dynamically typed, so the first row
+                    # cannot tell which columns hold blobs; they are the only
+                    # values sqlite3 returns that need converting
+                    data = [
+                        [
+                            value.decode('utf-8', errors='replace') if type(value) is bytes else value
+                            for value in row
+                        ]
+                        for row in raw_rows
+                    ]
                 
                 cursor.close()
+                message = f"Query successful, returned {len(data)} rows"
+                if truncated:
+                    message += f" (truncated to max_rows={max_rows})"
                 return QueryResult(
                     success=True,
                     columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                    message=f"Query successful, returned {len(rows)} rows"
+                    data=data,
+                    row_count=len(data),
+                    message=message,
+                    truncated=truncated
                 )
             else:
                 self._connection.commit()
                 affected = cursor.rowcount
                 cursor.close()
+                if keyword in DDL_KEYWORDS:
+                    self._metadata_cache.invalidate()
+                elif affected:
+                    # Table listings carry exact row counts
+                    self._metadata_cache.invalidate_listings()
                 return QueryResult(
                     success=True,
                     affected_rows=affected,
@@ -148,66 +277,203 @@ class SQLiteAdapter(DatabaseAdapter):
                 message="SQL execution failed"
             )
     
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
-        """List all tables in the database."""
+    def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """Execute sql once per parameter set (? placeholders), in one transaction."""
+        if not self._connected or not self._connection:
+            return QueryResult(
+                success=False,
+                error="Not connected to database",
+                message="Please connect to the database first"
+            )
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.executemany(sql, params_batch)
+            self._connection.commit()
+            affected = cursor.rowcount
+            cursor.close()
+        except sqlite3.Error as e:
+            self._connection.rollback()
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="SQL execution failed"
+            )
+        
+        # Table listings carry exact row counts
+        self._metadata_cache.invalidate_listings()
+        return QueryResult(
+            success=True,
+            affected_rows=affected,
+            message=f"Batch execution successful, {len(params_batch)} parameter sets, affected {affected} rows"
+        )
+    
+    def _count_rows(self, cursor: sqlite3.Cursor, names: list[str]) -> list[int | None]:
+        """
+        Count the rows of each named table or view.
+        
+        Counts are gathered with one UNION ALL query per MAX_COMPOUND_SELECT
+        tables. If that query fails, e.g. because a view is broken, its
+        tables are counted one by one and the failing ones get None.
+        """
+        counts: list[int | None] = []
+        for start in range(0, len(names), MAX_COMPOUND_SELECT):
+            chunk = names[start:start + MAX_COMPOUND_SELECT]
+            sql = " UNION ALL ".join(
+                f"SELECT {index}, COUNT(*) FROM {_quote_identifier(name)}"
+                for index, name in enumerate(chunk)
+            )
+            try:
+                cursor.execute(sql)
+                chunk_counts = dict(cursor.fetchall())
+                counts.extend(chunk_counts[index] for index in range(len(chunk)))
+            except sqlite3.Error:
+                for name in chunk:
+                    try:
+                        cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(name)}")
+                        counts.append(cursor.fetchone()[0])
+                    except sqlite3.Error:
+                        counts.append(None)
+        return counts
+    
+    def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> list[TableInfo]:
+        """List tables in the database, ordered by name."""
         if not self._connected:
             return []
         
+        cached = self._metadata_cache.get_listing(self.db_type, schema, limit, offset)
+        if cached is not None:
+            return cached
+        
         try:
             cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT name, type
-                FROM sqlite_master
-                WHERE type IN ('table', 'view')
-                AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """)
+            cursor.execute(_LIST_TABLES_SQL, (-1 if limit is None else limit, offset))
             
-            tables = []
-            for row in cursor.fetchall():
-                # Get row count for each table
-                table_name = row[0]
-                try:
-                    # Safe identifier escaping
-                    escaped_name = table_name.replace('"', '""')
-                    cursor.execute(f'SELECT COUNT(*) FROM "{escaped_name}"')
-                    row_count = cursor.fetchone()[0]
-                except sqlite3.Error:
-                    row_count = None
-                
-                tables.append(TableInfo(
-                    name=table_name,
-                    table_type=row[1].upper(),
+            # Only the tables on this page have their rows counted
+            rows = cursor.fetchall()
+            row_counts = self._count_rows(cursor, [row[0] for row in rows])
+            
+            tables = [
+                TableInfo(
+                    name=row[0],
+                    table_type=sys.intern(row[1].upper()),
                     row_count=row_count
-                ))
+                )
+                for row, row_count in zip(rows, row_counts)
+            ]
             
             cursor.close()
+            self._metadata_cache.set_listing(self.db_type, schema, limit, offset, tables)
             return tables
         except sqlite3.Error:
             return []
     
+    def count_tables(self, schema: str | None = None) -> int:
+        """Count the tables and views in the database."""
+        if not self._connected:
+            return 0
+        
+        cache_key = (self.db_type, schema, None, "count")
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(_COUNT_TABLES_SQL)
+            count = cursor.fetchone()[0]
+            cursor.close()
+            self._metadata_cache.set(cache_key, count)
+            return count
+        except sqlite3.Error:
+            return 0
+    
     def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """Get table structure."""
         if not self._connected:
             return []
         
+        cache_key = (self.db_type, schema, table_name)
+        cached = self._metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             cursor = self._connection.cursor()
-            # Safe identifier escaping
-            escaped_name = table_name.replace('"', '""')
-            cursor.execute(f'PRAGMA table_info("{escaped_name}")')
+            # Bound as a parameter so sqlite3's statement cache reuses one
+            # compiled statement for every table
+            cursor.execute("SELECT * FROM pragma_table_info(?)", (table_name,))
             
-            columns = []
-            for row in cursor.fetchall():
-                columns.append(ColumnInfo(
+            columns = [
+                ColumnInfo(
                     name=row[1],  # name
-                    data_type=row[2],  # type
+                    data_type=sys.intern(row[2]),  # type
                     nullable=not row[3],  # notnull (inverted)
                     is_primary_key=bool(row[5]),  # pk
                     default_value=row[4]  # dflt_value
-                ))
+                )
+                for row in cursor
+            ]
             
             cursor.close()
+            if columns:
+                self._metadata_cache.set(cache_key, columns)
             return columns
         except sqlite3.Error:
             return []
+    
+    def describe_schema(self, schema: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of every table and view in the database."""
+        if not self._connected:
+            return {}
+        
+        cached = self._metadata_cache.get((self.db_type, schema, None, "columns"))
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(_DESCRIBE_SCHEMA_SQL)
+            
+            columns_by_table = _columns_by_table(cursor)
+            
+            cursor.close()
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table)
+            return columns_by_table
+        except sqlite3.Error:
+            return {}
+    
+    def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables."""
+        if not self._connected:
+            return {}
+        
+        found, missing = self._metadata_cache.get_descriptions(self.db_type, schema, table_names)
+        if not missing:
+            return found
+        
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute(_describe_tables_sql(len(missing)), missing)
+            columns_by_table = _columns_by_table(cursor)
+            cursor.close()
+            
+            self._metadata_cache.set_descriptions(self.db_type, schema, columns_by_table, whole_schema=False)
+            found.update(columns_by_table)
+            return found
+        except sqlite3.Error:
+            return found
@@ -3,11 +3,68 @@
 Reads database connection parameters from environment variables.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 
+# Default ports for each database type
+DEFAULT_PORTS = {
+    "mysql": 3306,
+    "postgres": 5432,
+    "mssql": 1433,
+    "dm8": 5236,
+    "sqlite": 0,
+}
 
-@dataclass
+
+# Default bounds of the connection pool kept by each asyncio adapter
+# (asyncpg, aiomysql, aioodbc); the maximum is also how many tool calls
+# can query the database at once
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 10
+
+
+def _pool_size_from_env(name: str, default: int, minimum: int) -> int:
+    """Read a pool size from the environment, rejecting invalid values."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        size = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}")
+    if size < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {size}")
+    return size
+
+
+# Pool bounds, overridable with DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE. Bad
+# values fail at startup rather than when the first connection is made,
+# and a minimum above the maximum is lowered to it
+POOL_MAX_SIZE = _pool_size_from_env("DB_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE, 1)
+POOL_MIN_SIZE = min(_pool_size_from_env("DB_POOL_MIN_SIZE", DEFAULT_POOL_MIN_SIZE, 0), POOL_MAX_SIZE)
+
+
+def _seconds_from_env(name: str, default: float) -> float:
+    """Read a number of seconds from the environment, rejecting invalid values."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number of seconds, got {value!r}")
+    if not seconds >= 0:
+        raise ValueError(f"{name} must be zero or more seconds, got {value!r}")
+    return seconds
+
+
+# Seconds a SELECT result may be served again without running the query;
+# 0 (the default) disables the result cache. Bad values fail at startup
+RESULT_CACHE_TTL = _seconds_from_env("DB_RESULT_CACHE_TTL", 0.0)
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database connection configuration."""
     
@@ -20,32 +77,13 @@ class DatabaseConfig:
     
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
-        """Create configuration from environment variables."""
-        dbtype = os.getenv("DB_TYPE", "sqlite").lower()
-        
-        # Default ports for each database type
-        default_ports = {
-            "mysql": 3306,
-            "postgres": 5432,
-            "mssql": 1433,
-            "dm8": 5236,
-            "sqlite": 0,
-        }
-        
-        port_str = os.getenv("DB_PORT", "")
-        if port_str:
-            port = int(port_str)
-        else:
-            port = default_ports.get(dbtype, 0)
+        """
+        Create configuration from environment variables.
         
-        return cls(
-            dbtype=dbtype,
-            host=os.getenv("DB_HOST", "localhost"),
-            port=port,
-            username=os.getenv("DB_USER", ""),
-            password=os.getenv("DB_PASSWORD", ""),
-            dbname=os.getenv("DB_NAME", ""),
-        )
+        The environment is read once per process; later calls return the
+        same (immutable) instance.
+        """
+        return _config_from_env(cls)
     
     def to_dict(self) -> dict:
         """Convert to dictionary (excluding password for safety)."""
@@ -58,5 +96,27 @@ class DatabaseConfig:
         }
 
 
+@functools.cache
+def _config_from_env(cls: type[DatabaseConfig]) -> DatabaseConfig:
+    env = os.environ
+    dbtype = env.get("DB_TYPE", "sqlite").lower()
+    
+    port_str = env.get("DB_PORT")
+    if port_str:
+        port = int(port_str)
+    else:
+        port = DEFAULT_PORTS.get(dbtype, 0)
+    
+    return cls(
+        dbtype=dbtype,
+        host=env.get("DB_HOST", "localhost"),
+        port=port,
+        username=env.get("DB_USER", ""),
+        password=env.get("DB_PASSWORD", ""),
+        dbname=env.get("DB_NAME", ""),
+    )
+
+
 # Supported database types
 SUPPORTED_DBTYPES = ["mysql", "postgres", "mssql", "dm8", "sqlite"]
+SUPPORTED_DBTYPES_SET = frozenset(SUPPORTED_DBTYPES)
@@ -4,12 +4,44 @@ Manages database connections with support for runtime switching between database
 Uses the lifespan pattern for MCP server integration.
 """
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
 
-from .config import DatabaseConfig
+from .config import DatabaseConfig, RESULT_CACHE_TTL
+from .pagination import (
+    parse_order_by,
+    build_page_query,
+    key_indices,
+    encode_page_token,
+    decode_page_token,
+)
 from .adapters import get_adapter
-from .adapters.base import DatabaseAdapter, TableInfo, ColumnInfo, QueryResult
+from .adapters.base import (
+    DatabaseAdapter,
+    AsyncDatabaseAdapter,
+    TableInfo,
+    ColumnInfo,
+    QueryResult,
+    TTLCache,
+    DEFAULT_MAX_ROWS,
+    DDL_WORD_RE,
+    first_keyword,
+)
+
+# Most SELECT results kept by the result cache (see DB_RESULT_CACHE_TTL)
+RESULT_CACHE_SIZE = 256
+
+# Leading keywords of statements whose results may be cached
+_CACHEABLE_KEYWORDS = frozenset({"SELECT", "SHOW"})
+
+
+def create_adapter(dbtype: str) -> DatabaseAdapter | AsyncDatabaseAdapter:
+    """Create the asyncio adapter for dbtype if its driver is installed, else the sync one."""
+    try:
+        return get_adapter(dbtype, async_=True)
+    except (ValueError, ImportError):
+        return get_adapter(dbtype)
 
 
 @dataclass
@@ -18,13 +50,30 @@ class DatabaseManager:
     Manages database connections for the MCP server.
     
     Supports connecting to multiple database types and switching between them at runtime.
+    Native asyncio adapters are awaited directly; sync adapters run in a worker
+    thread, one call at a time, so they never block the event loop.
     """
     
-    adapter: DatabaseAdapter | None = None
+    adapter: DatabaseAdapter | AsyncDatabaseAdapter | None = None
     config: DatabaseConfig | None = None
     connection_info: dict[str, Any] | None = None
+    _sync_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    # Connection state, kept in step by connect() and disconnect()
+    _connected: bool = field(default=False, repr=False)
+    _db_type: str | None = field(default=None, repr=False)
+    # (SQL text, max_rows) -> QueryResult of a recent read
+    _result_cache: TTLCache = field(
+        default_factory=lambda: TTLCache(RESULT_CACHE_TTL, RESULT_CACHE_SIZE), repr=False
+    )
+    
+    async def _call(self, method: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call an adapter method, off the event loop if the adapter is sync."""
+        if isinstance(self.adapter, AsyncDatabaseAdapter):
+            return await method(*args, **kwargs)
+        async with self._sync_lock:
+            return await asyncio.to_thread(method, *args, **kwargs)
     
-    def connect(
+    async def connect(
         self,
         dbtype: str,
         host: str,
@@ -32,11 +81,15 @@ class DatabaseManager:
         username: str,
         password: str,
         dbname: str,
+        force_reconnect: bool = False,
         **kwargs
     ) -> dict[str, Any]:
         """
         Connect to a database, disconnecting from any existing connection first.
         
+        Asking again for the database already connected to, with the same
+        credentials, keeps the live connection unless force_reconnect is set.
+        
         Args:
             dbtype: Database type (mysql, postgres, mssql, dm8, sqlite)
             host: Database host
@@ -44,18 +97,34 @@ class DatabaseManager:
             username: Database username
             password: Database password
             dbname: Database name (or file path for SQLite)
+            force_reconnect: Reconnect even if the settings are unchanged
             **kwargs: Additional connection parameters
             
         Returns:
             dict with connection info
         """
+        config = DatabaseConfig(
+            dbtype=dbtype,
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            dbname=dbname
+        )
+        if self._connected and not force_reconnect and not kwargs and config == self.config:
+            return self.connection_info
+        
         # Disconnect from existing connection if any
-        if self.adapter and self.adapter.is_connected:
-            self.disconnect()
+        if self._connected:
+            await self.disconnect()
         
         # Create new adapter and connect
-        self.adapter = get_adapter(dbtype)
-        self.connection_info = self.adapter.connect(
+        self._result_cache.clear()
+        self._connected = False
+        self._db_type = None
+        self.adapter = create_adapter(dbtype)
+        self.connection_info = await self._call(
+            self.adapter.connect,
             host=host,
             port=port,
             username=username,
@@ -65,63 +134,249 @@ class DatabaseManager:
         )
         
         # Store config for reference
-        self.config = DatabaseConfig(
-            dbtype=dbtype,
-            host=host,
-            port=port,
-            username=username,
-            password=password,
-            dbname=dbname
-        )
+        self.config = config
+        self._connected = True
+        self._db_type = self.adapter.db_type
         
         return self.connection_info
     
-    def connect_from_config(self, config: DatabaseConfig) -> dict[str, Any]:
+    async def connect_from_config(
+        self,
+        config: DatabaseConfig,
+        force_reconnect: bool = False
+    ) -> dict[str, Any]:
         """Connect using a DatabaseConfig object."""
-        return self.connect(
+        return await self.connect(
             dbtype=config.dbtype,
             host=config.host,
             port=config.port,
             username=config.username,
             password=config.password,
-            dbname=config.dbname
+            dbname=config.dbname,
+            force_reconnect=force_reconnect
         )
     
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         """Disconnect from the current database."""
         if self.adapter:
-            self.adapter.disconnect()
+            await self._call(self.adapter.disconnect)
+        self._result_cache.clear()
+        self._connected = False
+        self._db_type = None
         self.adapter = None
+        self.config = None
         self.connection_info = None
     
     @property
     def is_connected(self) -> bool:
         """Check if currently connected to a database."""
-        return self.adapter is not None and self.adapter.is_connected
+        return self._connected
     
     @property
     def current_db_type(self) -> str | None:
         """Get the current database type."""
-        return self.adapter.db_type if self.adapter else None
+        return self._db_type
     
-    def execute_query(self, sql: str, timeout: int = 30) -> QueryResult:
-        """Execute a SQL query on the current connection."""
+    async def execute_query(
+        self,
+        sql: str,
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """
+        Execute a SQL query on the current connection.
+        
+        When DB_RESULT_CACHE_TTL is set, SELECT/SHOW results are reused for
+        repeats of the same SQL text within that many seconds. Any other
+        statement clears the cache, and if it mentions a DDL keyword, the
+        adapter's cached table metadata too.
+        """
         if not self.adapter:
             return QueryResult(
                 success=False,
                 error="No database connection",
                 message="Please connect to a database using connect_database first"
             )
-        return self.adapter.execute_query(sql, timeout=timeout)
+        
+        cacheable = first_keyword(sql) in _CACHEABLE_KEYWORDS
+        if not cacheable:
+            self._result_cache.clear()
+        elif RESULT_CACHE_TTL > 0:
+            cached = self._result_cache.get((sql, max_rows))
+            if cached is not None:
+                return cached
+        
+        result = await self._call(self.adapter.execute_query, sql, timeout=timeout, max_rows=max_rows)
+        if cacheable:
+            if RESULT_CACHE_TTL > 0 and result.success:
+                self._result_cache.set((sql, max_rows), result)
+        elif DDL_WORD_RE.search(sql):
+            # Adapters only spot DDL by the leading keyword, which misses it
+            # inside scripts such as BEGIN; ALTER TABLE ...; COMMIT
+            self.adapter.invalidate_metadata()
+        return result
+    
+    async def execute_queries(
+        self,
+        sqls: Sequence[str],
+        timeout: int = 30,
+        max_rows: int | None = DEFAULT_MAX_ROWS
+    ) -> list[QueryResult]:
+        """
+        Execute independent queries concurrently, returning results in order.
+        
+        With an asyncio adapter each query borrows its own pooled connection,
+        so their round trips overlap; a sync adapter still runs them one at
+        a time. A query that raises gets a failed result of its own.
+        """
+        results = await asyncio.gather(
+            *(self.execute_query(sql, timeout=timeout, max_rows=max_rows) for sql in sqls),
+            return_exceptions=True
+        )
+        return [
+            result if isinstance(result, QueryResult) else QueryResult(
+                success=False,
+                error=str(result) or type(result).__name__,
+                message="SQL execution failed"
+            )
+            for result in results
+        ]
     
-    def list_tables(self, schema: str | None = None) -> list[TableInfo]:
-        """List all tables in the current database."""
+    async def execute_many(
+        self,
+        sql: str,
+        params_batch: Sequence[Sequence[Any]],
+        timeout: int = 30
+    ) -> QueryResult:
+        """Execute one statement once per parameter set, as a single batch."""
         if not self.adapter:
-            return []
-        return self.adapter.list_tables(schema)
+            return QueryResult(
+                success=False,
+                error="No database connection",
+                message="Please connect to a database using connect_database first"
+            )
+        
+        self._result_cache.clear()
+        result = await self._call(self.adapter.execute_many, sql, params_batch, timeout=timeout)
+        if DDL_WORD_RE.search(sql):
+            self.adapter.invalidate_metadata()
+        return result
+    
+    async def execute_query_paginated(
+        self,
+        sql: str,
+        page_size: int,
+        page_token: str | None = None,
+        timeout: int = 30
+    ) -> QueryResult:
+        """
+        Execute one page of an ordered SELECT using keyset pagination.
+        
+        The query's ORDER BY columns must identify rows uniquely and be
+        non-NULL. Pass the returned next_cursor back as page_token to read
+        the following page; it is None on the last page.
+        """
+        if not self.adapter:
+            return QueryResult(
+                success=False,
+                error="No database connection",
+                message="Please connect to a database using connect_database first"
+            )
+        
+        try:
+            if first_keyword(sql) not in ("SELECT", "WITH"):
+                raise ValueError("Only SELECT queries can be paginated")
+            if page_size < 1:
+                raise ValueError("page_size must be at least 1")
+            body, keys = parse_order_by(sql)
+            last_key = decode_page_token(sql, page_token, len(keys)) if page_token else None
+            # One extra row tells us whether another page follows
+            page_sql = build_page_query(body, keys, last_key, page_size + 1, self._db_type)
+        except ValueError as e:
+            return QueryResult(
+                success=False,
+                error=str(e),
+                message="Query cannot be paginated"
+            )
+        
+        result = await self._call(self.adapter.execute_query, page_sql, timeout=timeout, max_rows=page_size)
+        if result.success and result.truncated:
+            try:
+                indices = key_indices(result.columns, keys)
+                last_row = result.data[-1]
+                result.next_cursor = encode_page_token(sql, [last_row[index] for index in indices])
+            except ValueError as e:
+                return QueryResult(
+                    success=False,
+                    error=str(e),
+                    message="Query cannot be paginated"
+                )
+            result.truncated = False
+            result.message = f"Query successful, returned {result.row_count} rows (more available)"
+        return result
     
-    def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
+    async def list_tables(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> tuple[list[TableInfo], int]:
+        """
+        List one page of the tables in the current database.
+        
+        Returns:
+            The tables on the page and the total number of tables. The total
+            is only counted separately when the page does not reveal it.
+        """
+        if not self.adapter:
+            return [], 0
+        tables = await self._call(self.adapter.list_tables, schema, limit, offset)
+        if limit is None or len(tables) < limit and (tables or offset == 0):
+            return tables, offset + len(tables)
+        return tables, await self._call(self.adapter.count_tables, schema)
+    
+    async def describe_table(self, table_name: str, schema: str | None = None) -> list[ColumnInfo]:
         """Get table structure."""
         if not self.adapter:
             return []
-        return self.adapter.describe_table(table_name, schema)
+        return await self._call(self.adapter.describe_table, table_name, schema)
+    
+    async def describe_tables(
+        self,
+        table_names: Sequence[str],
+        schema: str | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        """Get the structure of several tables with one catalog query."""
+        if not self.adapter:
+            return {}
+        # A repeated name would otherwise have its columns listed twice
+        return await self._call(self.adapter.describe_tables, list(dict.fromkeys(table_names)), schema)
+    
+    async def get_catalog_bundle(
+        self,
+        schema: str | None = None,
+        limit: int | None = None,
+        offset: int = 0
+    ) -> dict[str, Any]:
+        """
+        List a page of tables together with the columns of every table.
+        
+        The columns of the whole schema come from one catalog query instead
+        of one describe_table round trip per table, and are cached so later
+        describe_table calls need no query at all.
+        
+        Returns:
+            dict with "tables", "total_count" and "columns_by_table"
+            (table name -> list of ColumnInfo)
+        """
+        if not self.adapter:
+            return {"tables": [], "total_count": 0, "columns_by_table": {}}
+        (tables, total_count), columns_by_table = await asyncio.gather(
+            self.list_tables(schema, limit, offset),
+            self._call(self.adapter.describe_schema, schema)
+        )
+        return {
+            "tables": tables,
+            "total_count": total_count,
+            "columns_by_table": columns_by_table
+        }
@@ -0,0 +1,199 @@
+"""Keyset pagination for SELECT statements.
+
+A page is read by wrapping the user's query in a subquery that keeps only the
+rows after the last ORDER BY key of the previous page, re-applies the ordering
+and limits the row count. Every page therefore costs the same however deep into
+the result it is, unlike OFFSET. The position travels back to the client as an
+opaque token, so no cursor state is kept on the server.
+"""
+
+import base64
+import hashlib
+import json
+import math
+import re
+from typing import Any
+
+# String literals, quoted identifiers, comments, parentheses, commas and words
+_TOKEN_RE = re.compile(
+    r"""
+      '(?:[^']|'')*'
+    | "(?:[^"]|"")*"
+    | `(?:[^`]|``)*`
+    | \[[^\]]*\]
+    | --[^\n]*
+    | /\*.*?\*/
+    | [(),;]
+    | [^\s'"`\[(),;]+
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# A column reference, optionally qualified and quoted, with its direction
+_ORDER_ITEM_RE = re.compile(
+    r"""
+    ^(?:(?:[^\W\d]\w*|"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])\.)*
+    (?P<column>[^\W\d]\w*|"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])
+    (?:\s+(?P<direction>ASC|DESC))?$
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Clauses that would clash with the LIMIT added for each page
+_ROW_LIMIT_KEYWORDS = frozenset({"LIMIT", "OFFSET", "FETCH", "FOR"})
+
+
+def _top_level_tokens(sql: str) -> list[tuple[str, int]]:
+    """Return the (upper-cased word, offset) pairs found outside parentheses."""
+    tokens = []
+    depth = 0
+    for match in _TOKEN_RE.finditer(sql):
+        text = match.group()
+        if text == "(":
+            depth += 1
+        elif text == ")":
+            depth -= 1
+        elif depth == 0 and not text.startswith(("--", "/*")):
+            tokens.append((text.upper(), match.start()))
+    return tokens
+
+
+def parse_order_by(sql: str) -> tuple[str, list[tuple[str, bool]]]:
+    """
+    Split a SELECT statement into its body and its top-level ORDER BY keys.
+    
+    Returns:
+        The statement without the ORDER BY clause (and trailing semicolon),
+        and one (column, descending) pair per ORDER BY item, with the column
+        as written in the query minus any table qualifier.
+    
+    Raises:
+        ValueError: If the statement has no ORDER BY on plain columns, or
+                    already limits its rows.
+    """
+    sql = sql.rstrip().rstrip(";").rstrip()
+    tokens = _top_level_tokens(sql)
+    
+    order_at = None
+    for index in range(len(tokens) - 1):
+        if tokens[index][0] == "ORDER" and tokens[index + 1][0] == "BY":
+            order_at = index
+    if order_at is None:
+        raise ValueError("Pagination needs an ORDER BY clause on unique, non-NULL columns")
+    
+    clause_tokens = tokens[order_at + 2:]
+    if any(word in _ROW_LIMIT_KEYWORDS for word, _ in clause_tokens):
+        raise ValueError("Remove LIMIT/OFFSET/FETCH/FOR from a query to paginate it")
+    if any(word == "TOP" for word, _ in tokens):
+        raise ValueError("Remove TOP from a query to paginate it")
+    
+    clause_start = tokens[order_at + 2][1] if len(tokens) > order_at + 2 else len(sql)
+    starts = [clause_start] + [offset + 1 for word, offset in clause_tokens if word == ","]
+    ends = [offset for word, offset in clause_tokens if word == ","] + [len(sql)]
+    
+    keys = []
+    for start, end in zip(starts, ends):
+        item = sql[start:end].strip()
+        match = _ORDER_ITEM_RE.match(item)
+        if match is None:
+            raise ValueError(f"Pagination can only order by plain columns, not: {item}")
+        direction = (match.group("direction") or "ASC").upper()
+        keys.append((match.group("column"), direction == "DESC"))
+    
+    return sql[:tokens[order_at][1]].rstrip(), keys
+
+
+def key_indices(columns: list[str] | tuple[str, ...], keys: list[tuple[str, bool]]) -> list[int]:
+    """
+    Find the result column holding each ORDER BY key.
+    
+    Quoted keys must match exactly; bare ones are matched case-insensitively,
+    as unquoted identifiers are case-insensitive in every supported database.
+    """
+    indices = []
+    for column, _ in keys:
+        if column[0] in "\"`[":
+            name = column[1:-1]
+            found = [index for index, col in enumerate(columns) if col == name]
+        else:
+            found = [index for index, col in enumerate(columns) if col.lower() == column.lower()]
+        if not found:
+            raise ValueError(f"ORDER BY column {column} must appear in the select list to paginate")
+        indices.append(found[0])
+    return indices
+
+
+def _literal(value: Any, db_type: str) -> str:
+    """Render a key value from a page token as a SQL literal."""
+    if isinstance(value, bool) or value is None:
+        raise ValueError("Page keys must be non-NULL numbers or strings")
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError("Page keys must be finite numbers")
+        return repr(value)
+    text = str(value).replace("'", "''")
+    if db_type == "mysql":
+        # MySQL also treats backslashes as escapes in string literals
+        text = text.replace("\\", "\\\\")
+    return f"N'{text}'" if db_type == "mssql" else f"'{text}'"
+
+
+def build_page_query(
+    body: str,
+    keys: list[tuple[str, bool]],
+    last_key: list[Any] | None,
+    limit: int,
+    db_type: str
+) -> str:
+    """
+    Build the query reading the rows after last_key, at most limit of them.
+    
+    The keyset condition is spelled out as (a > x) OR (a = x AND b > y) ...
+    rather than a row-value comparison, which SQL Server does not support,
+    and so that each key can sort in its own direction.
+    """
+    order_by = ", ".join(f"{column} DESC" if descending else column for column, descending in keys)
+    sql = f"SELECT * FROM (\n{body}\n) page_source"
+    
+    if last_key is not None:
+        branches = []
+        for position, (column, descending) in enumerate(keys):
+            terms = [f"{col} = {_literal(value, db_type)}" for (col, _), value in zip(keys, last_key[:position])]
+            terms.append(f"{column} {'<' if descending else '>'} {_literal(last_key[position], db_type)}")
+            branches.append("(" + " AND ".join(terms) + ")")
+        sql += "\nWHERE " + " OR ".join(branches)
+    
+    if db_type == "mssql":
+        return f"{sql}\nORDER BY {order_by}\nOFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
+    return f"{sql}\nORDER BY {order_by}\nLIMIT {limit}"
+
+
+def _fingerprint(sql: str) -> str:
+    return hashlib.blake2b(sql.encode(), digest_size=8).hexdigest()
+
+
+def encode_page_token(sql: str, last_key: list[Any]) -> str:
+    """Pack the last key of a page into an opaque token bound to sql."""
+    payload = json.dumps({"q": _fingerprint(sql), "k": last_key}, default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_page_token(sql: str, token: str, key_count: int) -> list[Any]:
+    """
+    Unpack the last key from a page token.
+    
+    Raises:
+        ValueError: If the token is malformed or was issued for other SQL.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        fingerprint, last_key = payload["q"], payload["k"]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid page token")
+    if fingerprint != _fingerprint(sql):
+        raise ValueError("Page token was issued for a different query")
+    if not isinstance(last_key, list) or len(last_key) != key_count:
+        raise ValueError("Invalid page token")
+    return last_key
@@ -4,24 +4,124 @@ A multi-database MCP server supporting MySQL, PostgreSQL, SQL Server, DM8, and S
 Provides tools for database connection, SQL execution, table listing, and schema inspection.
 """
 
-from collections.abc import AsyncIterator
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Annotated
+from typing import Annotated, Any
 
+import pydantic_core
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.session import ServerSession
+from mcp.types import TextContent
 
-from .config import DatabaseConfig, SUPPORTED_DBTYPES
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .config import DatabaseConfig, SUPPORTED_DBTYPES, SUPPORTED_DBTYPES_SET, DEFAULT_PORTS
 from .connection_manager import DatabaseManager
+from .adapters.base import close_all_pools, ColumnInfo, QueryResult, DEFAULT_MAX_ROWS
+
+# Hints returned when connect_database fails
+_CONNECT_SUGGESTIONS = (
+    "Verify the host address is correct",
+    "Check if the port is accessible and not blocked by a firewall",
+    "Ensure username and password are accurate",
+    "Confirm the database service is running on the target host",
+)
+_SQLITE_CONNECT_SUGGESTIONS = (
+    "Check if the database file path exists",
+    "Verify file permissions",
+)
+
+
+def _column_dict(column: ColumnInfo) -> dict:
+    """Describe a column the way describe_table reports it."""
+    return {
+        "name": column.name,
+        "type": column.data_type,
+        "nullable": column.nullable,
+        "primary_key": column.is_primary_key,
+        "default": column.default_value,
+        "extra": column.extra
+    }
+
+
+def _query_response(result: QueryResult, row_format: str) -> dict:
+    """Build execute_sql's response for one statement."""
+    return {
+        "success": result.success,
+        "columns": result.columns,
+        "rows": result.data if row_format == "arrays" else result.rows,
+        "row_count": result.row_count,
+        "affected_rows": result.affected_rows,
+        "truncated": result.truncated,
+        "message": result.message,
+        "error": result.error
+    }
+
+
+def _encode(response: dict) -> TextContent:
+    """Encode a tool response into the text block FastMCP would send for it."""
+    if orjson is not None:
+        text = orjson.dumps(response, default=str, option=orjson.OPT_INDENT_2).decode()
+    else:
+        text = pydantic_core.to_json(response, fallback=str, indent=2).decode()
+    return TextContent(type="text", text=text)
+
+
+# Replies that never change, encoded once at import. FastMCP passes a
+# returned text block through as it is; the tools stay annotated -> dict
+# because FastMCP would derive an output schema from any other return type
+_NOT_CONNECTED_RESPONSE = _encode({
+    "success": False,
+    "error": "Database not connected",
+    "message": "Please connect to a database using connect_database first",
+    "suggestions": ["Use connect_database tool to establish a connection"]
+})
+_DISCONNECTED_STATUS_RESPONSE = _encode({
+    "connected": False,
+    "message": "Not connected to any database"
+})
+
+
+def _orjson_response(
+    tool: Callable[..., Awaitable[dict | TextContent]]
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Serialize a tool's response with orjson, when it is installed.
+    
+    FastMCP sends a dict result as a text block holding the dict as indented
+    JSON, encoded through pydantic. The wrapper returns that same text block,
+    built several times faster, which matters for large query results.
+    Precomputed text blocks are returned unchanged.
+    """
+    if orjson is None:
+        return tool
+    
+    @functools.wraps(tool)
+    async def wrapper(*args, **kwargs):
+        response = await tool(*args, **kwargs)
+        if isinstance(response, TextContent):
+            return response
+        return _encode(response)
+    
+    return wrapper
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppContext:
     """Application context with database manager."""
     db: DatabaseManager
 
 
+def _db(ctx: Context[ServerSession, AppContext]) -> DatabaseManager:
+    """Get the database manager from a tool call's context."""
+    return ctx.request_context.lifespan_context.db
+
+
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """
@@ -38,9 +138,9 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         # Only auto-connect if we have the minimum required info
         if config.dbname or config.dbtype == "sqlite":
             if config.dbtype != "sqlite" and (config.username and config.password):
-                db_manager.connect_from_config(config)
+                await db_manager.connect_from_config(config)
             elif config.dbtype == "sqlite" and config.dbname:
-                db_manager.connect_from_config(config)
+                await db_manager.connect_from_config(config)
     except Exception:
         # If auto-connect fails, just continue - user can connect manually
         pass
@@ -49,7 +149,8 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         yield AppContext(db=db_manager)
     finally:
         # Cleanup on shutdown
-        db_manager.disconnect()
+        await db_manager.disconnect()
+        close_all_pools()
 
 
 # Create MCP server with lifespan
@@ -64,7 +165,8 @@ mcp = FastMCP(
     "readOnlyHint": False,
     "idempotentHint": False
 })
-def connect_database(
+@_orjson_response
+async def connect_database(
     ctx: Context[ServerSession, AppContext],
     dbtype: Annotated[str, "Database type: mysql, postgres, mssql, dm8, sqlite"],
     host: Annotated[str, "Database host address, can be ignored for SQLite"] = "localhost",
@@ -72,10 +174,14 @@ def connect_database(
     username: Annotated[str, "Database username, can be ignored for SQLite"] = "",
     password: Annotated[str, "Database password, can be ignored for SQLite"] = "",
     dbname: Annotated[str, "Database name, or file path for SQLite"] = "",
+    force_reconnect: Annotated[bool, "Reconnect even if already connected with these settings"] = False,
 ) -> dict:
     """
     Connect to a specified database. Disconnects existing connections first.
     
+    Connecting again with unchanged settings reuses the live connection;
+    set force_reconnect to open a fresh one, e.g. after a server restart.
+    
     Supported types: mysql, postgres, mssql, dm8, sqlite
     
     For SQLite, 'dbname' should be the absolute file path.
@@ -83,7 +189,7 @@ def connect_database(
     """
     dbtype = dbtype.lower()
     
-    if dbtype not in SUPPORTED_DBTYPES:
+    if dbtype not in SUPPORTED_DBTYPES_SET:
         return {
             "success": False,
             "error": f"Unsupported database type: {dbtype}",
@@ -92,25 +198,19 @@ def connect_database(
     
     # Set default port if not specified
     if port == 0:
-        default_ports = {
-            "mysql": 3306,
-            "postgres": 5432,
-            "mssql": 1433,
-            "dm8": 5236,
-            "sqlite": 0,
-        }
-        port = default_ports.get(dbtype, 0)
+        port = DEFAULT_PORTS.get(dbtype, 0)
     
-    db_manager = ctx.request_context.lifespan_context.db
+    db_manager = _db(ctx)
     
     try:
-        result = db_manager.connect(
+        result = await db_manager.connect(
             dbtype=dbtype,
             host=host,
             port=port,
             username=username,
             password=password,
-            dbname=dbname
+            dbname=dbname,
+            force_reconnect=force_reconnect
         )
         return {
             "success": True,
@@ -118,20 +218,11 @@ def connect_database(
             "connection_info": result
         }
     except Exception as e:
-        suggestions = [
-            "Verify the host address is correct",
-            "Check if the port is accessible and not blocked by a firewall",
-            "Ensure username and password are accurate",
-            "Confirm the database service is running on the target host"
-        ]
-        if dbtype == "sqlite":
-            suggestions = ["Check if the database file path exists", "Verify file permissions"]
-            
         return {
             "success": False,
             "error": str(e),
             "message": "Database connection failed",
-            "suggestions": suggestions
+            "suggestions": _SQLITE_CONNECT_SUGGESTIONS if dbtype == "sqlite" else _CONNECT_SUGGESTIONS
         }
 
 
@@ -140,10 +231,17 @@ def connect_database(
     "destructiveHint": True,
     "idempotentHint": False
 })
-def execute_sql(
+@_orjson_response
+async def execute_sql(
     ctx: Context[ServerSession, AppContext],
-    query: Annotated[str, "The SQL query to execute"],
+    query: Annotated[str | None, "The SQL query to execute"] = None,
+    queries: Annotated[list[str] | None, "Independent queries to run concurrently, instead of query"] = None,
     timeout: Annotated[int, "Query timeout in seconds"] = 30,
+    max_rows: Annotated[int, "Maximum rows to return, further rows are dropped and truncated is set"] = DEFAULT_MAX_ROWS,
+    page_size: Annotated[int, "Rows per page for an ordered SELECT (0 disables paging)"] = 0,
+    page_token: Annotated[str | None, "next_cursor from the previous page"] = None,
+    row_format: Annotated[str, "'objects' (a dict per row) or 'arrays' (a list per row, in columns order)"] = "objects",
+    params_batch: Annotated[list[list[Any]] | None, "Parameter sets to run the statement with, one execution each"] = None,
 ) -> dict:
     """
     Execute a SQL statement on the current connection.
@@ -151,38 +249,88 @@ def execute_sql(
     Supports SELECT queries and DML (INSERT/UPDATE/DELETE).
     Ensure you are connected using connect_database first.
     Be cautious with destructive operations like DROP/DELETE/TRUNCATE.
-    """
-    # Simple risk check
-    dangerous_keywords = ['DROP', 'TRUNCATE', 'DELETE']
-    sql_upper = query.strip().upper()
-    is_dangerous = any(keyword in sql_upper for keyword in dangerous_keywords)
     
-    if is_dangerous and 'WHERE' not in sql_upper and 'DELETE' in sql_upper:
-       # Potential warning logic could go here
-       pass
-
-    db_manager = ctx.request_context.lifespan_context.db
+    At most max_rows rows are fetched from the database, and truncated is
+    true if there were more. To page through a large SELECT instead, give it
+    an ORDER BY on unique, non-NULL columns and set page_size; repeat the
+    same query with page_token set to the returned next_cursor until
+    next_cursor is null.
+    
+    Set row_format to 'arrays' for large results: column names are then
+    not repeated in every row, which makes the response much smaller.
+    
+    To run one INSERT/UPDATE/DELETE for many rows, write it with
+    placeholders and pass the values in params_batch; the whole batch is
+    sent at once and runs in one transaction. Placeholders are $1, $2, ...
+    for PostgreSQL, %s for MySQL and SQL Server, and ? for SQLite and DM8.
+    
+    To run several unrelated queries, pass them in queries instead of
+    query; they run concurrently and results holds one response per query,
+    in the same order. Do not rely on the order in which they execute.
+    """
+    db_manager = _db(ctx)
     
     if not db_manager.is_connected:
+        return _NOT_CONNECTED_RESPONSE
+    
+    if (query is None) == (queries is None):
         return {
             "success": False,
-            "error": "Database not connected",
-            "message": "Please connect to a database using connect_database first",
-            "suggestions": ["Use connect_database tool to establish a connection"]
+            "error": "Pass exactly one of query and queries",
+            "message": "Give a single statement in query, or several in queries"
+        }
+    if queries is not None and (not queries or params_batch is not None or page_size > 0):
+        return {
+            "success": False,
+            "error": "Unsupported queries request",
+            "message": "queries needs at least one query and cannot be combined with params_batch or page_size"
         }
     
-    try:
-        result = db_manager.execute_query(query, timeout=timeout)
-        
+    if row_format not in ("objects", "arrays"):
         return {
-            "success": result.success,
-            "columns": result.columns,
-            "rows": result.rows,
-            "row_count": result.row_count,
-            "affected_rows": result.affected_rows,
-            "message": result.message,
-            "error": result.error
+            "success": False,
+            "error": f"Unsupported row_format: {row_format}",
+            "message": "row_format must be 'objects' or 'arrays'"
         }
+    
+    try:
+        if params_batch is not None:
+            if not params_batch:
+                return {
+                    "success": False,
+                    "error": "params_batch is empty",
+                    "message": "Pass at least one parameter set, or omit params_batch"
+                }
+            result = await db_manager.execute_many(query, params_batch, timeout=timeout)
+            return {
+                "success": result.success,
+                "affected_rows": result.affected_rows,
+                "batch_count": len(params_batch),
+                "message": result.message,
+                "error": result.error
+            }
+        
+        if queries is not None:
+            results = await db_manager.execute_queries(queries, timeout=timeout, max_rows=max(0, max_rows))
+            failed = sum(not result.success for result in results)
+            return {
+                "success": not failed,
+                "results": [_query_response(result, row_format) for result in results],
+                "query_count": len(results),
+                "message": f"Ran {len(results)} queries, {failed} failed"
+            }
+        
+        if page_size > 0:
+            result = await db_manager.execute_query_paginated(
+                query, page_size, page_token=page_token, timeout=timeout
+            )
+        else:
+            result = await db_manager.execute_query(query, timeout=timeout, max_rows=max(0, max_rows))
+        
+        response = _query_response(result, row_format)
+        if page_size > 0:
+            response["next_cursor"] = result.next_cursor
+        return response
     except Exception as e:
         return {
             "success": False,
@@ -195,48 +343,57 @@ def execute_sql(
     "readOnlyHint": True,
     "idempotentHint": True
 })
-def list_tables(
+@_orjson_response
+async def list_tables(
     ctx: Context[ServerSession, AppContext],
     schema: Annotated[str | None, "Schema name (optional)"] = None,
     limit: Annotated[int, "Maximum number of tables to return"] = 100,
     offset: Annotated[int, "Number of tables to skip"] = 0,
+    include_columns: Annotated[bool, "Also return each table's columns, as describe_table would"] = False,
 ) -> dict:
     """
     List all tables in the current database.
     
     Returns table names, types, and row count estimates.
     Supports pagination, defaults to the first 100 tables.
+    With include_columns, each table also carries its columns, read for the
+    whole schema in one query; prefer this over calling describe_table for
+    many tables.
     Ensure you are connected using connect_database first.
     """
-    db_manager = ctx.request_context.lifespan_context.db
+    db_manager = _db(ctx)
     
     if not db_manager.is_connected:
-        return {
-            "success": False,
-            "error": "Database not connected",
-            "message": "Please connect to a database using connect_database first",
-            "suggestions": ["Use connect_database tool to establish a connection"]
-        }
+        return _NOT_CONNECTED_RESPONSE
     
     try:
-        tables = db_manager.list_tables(schema)
-        total_count = len(tables)
-        
         start = max(0, offset)
-        end = min(total_count, start + limit)
-        paged_tables = tables[start:end]
+        if include_columns:
+            bundle = await db_manager.get_catalog_bundle(schema, max(0, limit), start)
+            paged_tables, total_count = bundle["tables"], bundle["total_count"]
+            columns_by_table = bundle["columns_by_table"]
+        else:
+            paged_tables, total_count = await db_manager.list_tables(schema, max(0, limit), start)
+        end = start + len(paged_tables)
+        
+        tables = [
+            {
+                "name": t.name,
+                "schema": t.schema,
+                "type": t.table_type,
+                "row_count": t.row_count
+            }
+            for t in paged_tables
+        ]
+        if include_columns:
+            for table in tables:
+                table["columns"] = [
+                    _column_dict(c) for c in columns_by_table.get(table["name"], ())
+                ]
         
         return {
             "success": True,
-            "tables": [
-                {
-                    "name": t.name,
-                    "schema": t.schema,
-                    "type": t.table_type,
-                    "row_count": t.row_count
-                }
-                for t in paged_tables
-            ],
+            "tables": tables,
             "table_count": len(paged_tables),
             "total_count": total_count,
             "offset": start,
@@ -255,7 +412,8 @@ def list_tables(
     "readOnlyHint": True,
     "idempotentHint": True
 })
-def describe_table(
+@_orjson_response
+async def describe_table(
     ctx: Context[ServerSession, AppContext],
     table_name: Annotated[str, "The name of the table"],
     schema: Annotated[str | None, "Schema name (optional)"] = None,
@@ -266,18 +424,13 @@ def describe_table(
     Returns column names, data types, nullability, keys, and default values.
     Ensure you are connected using connect_database first.
     """
-    db_manager = ctx.request_context.lifespan_context.db
+    db_manager = _db(ctx)
     
     if not db_manager.is_connected:
-        return {
-            "success": False,
-            "error": "Database not connected",
-            "message": "Please connect to a database using connect_database first",
-            "suggestions": ["Use connect_database tool to establish a connection"]
-        }
+        return _NOT_CONNECTED_RESPONSE
     
     try:
-        columns = db_manager.describe_table(table_name, schema)
+        columns = await db_manager.describe_table(table_name, schema)
         
         if not columns:
             return {
@@ -291,17 +444,7 @@ def describe_table(
             "success": True,
             "table_name": table_name,
             "schema": schema,
-            "columns": [
-                {
-                    "name": c.name,
-                    "type": c.data_type,
-                    "nullable": c.nullable,
-                    "primary_key": c.is_primary_key,
-                    "default": c.default_value,
-                    "extra": c.extra
-                }
-                for c in columns
-            ],
+            "columns": [_column_dict(c) for c in columns],
             "column_count": len(columns),
             "message": f"Table '{table_name}' has {len(columns)} columns"
         }
@@ -317,21 +460,74 @@ def describe_table(
     "readOnlyHint": True,
     "idempotentHint": True
 })
-def get_connection_status(
+@_orjson_response
+async def describe_tables(
     ctx: Context[ServerSession, AppContext],
+    table_names: Annotated[list[str], "The names of the tables"],
+    schema: Annotated[str | None, "Schema name (optional)"] = None,
 ) -> dict:
     """
-    Retrieve current database connection status.
+    Inspect the schemas of several tables at once.
     
-    Returns connection status, database type, and configuration info.
+    Returns the same column details as describe_table for each table, read
+    with a single catalog query; prefer it over calling describe_table for
+    each of many tables. Tables that cannot be found are listed in missing.
+    Ensure you are connected using connect_database first.
     """
-    db_manager = ctx.request_context.lifespan_context.db
+    db_manager = _db(ctx)
     
     if not db_manager.is_connected:
+        return _NOT_CONNECTED_RESPONSE
+    
+    if not table_names:
+        return {
+            "success": False,
+            "error": "table_names is empty",
+            "message": "Pass the name of at least one table"
+        }
+    
+    table_names = list(dict.fromkeys(table_names))
+    try:
+        columns_by_table = await db_manager.describe_tables(table_names, schema)
+        missing = [name for name in table_names if name not in columns_by_table]
+        
+        return {
+            "success": bool(columns_by_table),
+            "schema": schema,
+            "tables": {
+                name: [_column_dict(c) for c in columns_by_table[name]]
+                for name in table_names
+                if name in columns_by_table
+            },
+            "table_count": len(columns_by_table),
+            "missing": missing,
+            "message": f"Described {len(table_names) - len(missing)} of {len(table_names)} tables"
+        }
+    except Exception as e:
         return {
-            "connected": False,
-            "message": "Not connected to any database"
+            "success": False,
+            "error": str(e),
+            "message": "Error occurred while describing tables"
         }
+
+
+@mcp.tool(annotations={
+    "readOnlyHint": True,
+    "idempotentHint": True
+})
+@_orjson_response
+async def get_connection_status(
+    ctx: Context[ServerSession, AppContext],
+) -> dict:
+    """
+    Retrieve current database connection status.
+    
+    Returns connection status, database type, and configuration info.
+    """
+    db_manager = _db(ctx)
+    
+    if not db_manager.is_connected:
+        return _DISCONNECTED_STATUS_RESPONSE
     
     return {
         "connected": True,